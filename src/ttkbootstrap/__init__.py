@@ -33,10 +33,105 @@
 import colorsys
 import importlib.resources
 import json
+import weakref
+from functools import lru_cache
 from pathlib import Path
 from tkinter import ttk
 
-from PIL import ImageTk, Image, ImageDraw, ImageFont
+from PIL import ImageTk, Image, ImageColor, ImageDraw, ImageFont
+
+
+@lru_cache(maxsize=8)
+def _symbola_font(size):
+    """Load the *Symbola* font used to draw the checkmark and scrollbar arrow images. The font file is opened and parsed
+    once per size and then shared by every theme.
+
+    Args:
+        size (int): the font size in pixels.
+
+    Returns:
+        ImageFont.FreeTypeFont: the symbol font.
+    """
+    with importlib.resources.open_binary('ttkbootstrap', 'Symbola.ttf') as font_path:
+        return ImageFont.truetype(font_path, size)
+
+
+@lru_cache(maxsize=None)
+def _builtin_themes():
+    """Read and parse the ``themes.json`` file that ships with ttkbootstrap. The file does not change at run-time, so
+    it is only parsed the first time a ``Style`` is created.
+
+    Returns:
+        dict: the built-in theme settings and the default user themes path.
+    """
+    return json.loads(importlib.resources.read_text('ttkbootstrap', 'themes.json'))
+
+
+# top-left corner of each 2x2 dot on the 14x14 sizegrip image
+_SIZEGRIP_DOTS = ((9, 3), (6, 6), (9, 6), (3, 9), (6, 9), (9, 9))
+
+
+@lru_cache(maxsize=32)
+def _sizegrip_image_data(color):
+    """Build the raw RGBA pixel data for a sizegrip image of the specified color.
+
+    Args:
+        color (str): the color of the sizegrip dots.
+
+    Returns:
+        bytes: the pixel data of a 14x14 RGBA image.
+    """
+    pixel = bytes(ImageColor.getcolor(color, 'RGBA'))
+    data = bytearray(14 * 14 * 4)
+    for x, y in _SIZEGRIP_DOTS:
+        for row in (y, y + 1):
+            offset = (row * 14 + x) * 4
+            data[offset:offset + 8] = pixel * 2
+    return bytes(data)
+
+
+def _color_to_rgb(color):
+    """Convert a hexadecimal color value or a color name, such as 'white', to an rgb color value.
+
+    Args:
+        color (str): a hexadecimal color value or color name.
+
+    Returns:
+        tuple[float, float, float]: rgb color value; each channel is in the range 0 to 1.
+    """
+    if color.startswith('#'):
+        return Colors.hex_to_rgb(color)
+    r, g, b = ImageColor.getrgb(color)[:3]
+    return r / 255, g / 255, b / 255
+
+
+# states mapped by every menubutton style, in priority order
+_MENUBUTTON_STATES = ('disabled', 'pressed !disabled', 'hover !disabled')
+
+# configure options shared by every menubutton style
+_MENUBUTTON_CONFIGURE = {
+    'arrowpadding': (0, 0, 15, 0),
+    'relief': 'raised',
+    'focusthickness': 0,
+    'focuscolor': '',
+    'padding': (10, 5)}
+
+
+def _menubutton_settings(configure, state_colors):
+    """Build the settings for a single menubutton style.
+
+    Args:
+        configure (dict): the color and font options of the style; the options shared by every menubutton are added.
+        state_colors (dict): a (disabled, pressed, hover) tuple of colors for each mapped option; a state with a color
+            of ``None`` is not mapped.
+
+    Returns:
+        dict: the ``configure`` and ``map`` settings of the style.
+    """
+    return {
+        'configure': {**configure, **_MENUBUTTON_CONFIGURE},
+        'map': {option: [(state, color) for state, color in zip(_MENUBUTTON_STATES, colors) if color is not None]
+                for option, colors in state_colors.items()}}
 
 
 class Style(ttk.Style):
@@ -97,8 +192,7 @@ class Style(ttk.Style):
             themes_file (str): the path of the `themes.json` file.
         """
         # pre-defined themes
-        json_data = importlib.resources.read_text('ttkbootstrap', 'themes.json')
-        builtin_themes = json.loads(json_data)
+        builtin_themes = _builtin_themes()
 
         # application-defined or user-defined themes
         if themes_file is None:
@@ -149,7 +243,7 @@ class Style(ttk.Style):
         if not themename:
             return super().theme_use()
 
-        if all([themename, themename not in self._theme_names]):
+        if themename not in self._theme_names:
             print(f"{themename} is not a valid theme name. Please try one of the following:")
             print(list(self._theme_names))
             return
@@ -190,6 +284,11 @@ class ThemeDefinition:
         return f'name={self.name}, type={self.type}, font={self.font}, colors={self.colors}'
 
 
+# the main style color labels, and all theme color labels in the order of the ``Colors`` constructor arguments
+_MAIN_COLOR_LABELS = ('primary', 'secondary', 'success', 'info', 'warning', 'danger')
+_ALL_COLOR_LABELS = _MAIN_COLOR_LABELS + ('bg', 'fg', 'selectbg', 'selectfg', 'border', 'inputfg', 'inputbg')
+
+
 class Colors:
     """A class that contains the theme colors as well as several helper methods for manipulating colors.
 
@@ -223,6 +322,8 @@ class Colors:
             print(color_label, color)
     """
 
+    __slots__ = _ALL_COLOR_LABELS
+
     def __init__(self, primary, secondary, success, info, warning, danger, bg, fg, selectbg, selectfg,
                  border, inputfg, inputbg):
         """
@@ -263,8 +364,13 @@ class Colors:
 
         Returns:
             str: a hexadecimal color value.
+
+        Raises:
+            KeyError: if ``color_label`` is not a color label.
         """
-        return self.__dict__.get(color_label)
+        if color_label not in self.__slots__:
+            raise KeyError(color_label)
+        return getattr(self, color_label)
 
     def set(self, color_label, color_value):
         """Set a color property
@@ -278,13 +384,13 @@ class Colors:
             .. code-block:
                 set('primary', '#fafafa')
         """
-        self.__dict__[color_label] = color_value
+        setattr(self, color_label, color_value)
 
     def __iter__(self):
-        return iter(['primary', 'secondary', 'success', 'info', 'warning', 'danger'])
+        return iter(_MAIN_COLOR_LABELS)
 
     def __repr__(self):
-        return str((tuple(zip(self.__dict__.keys(), self.__dict__.values()))))
+        return str(tuple((label, getattr(self, label)) for label in self.__slots__))
 
     @staticmethod
     def label_iter():
@@ -293,10 +399,10 @@ class Colors:
             Returns:
                 iter: an iterator representing the name of the color properties
         """
-        return iter(['primary', 'secondary', 'success', 'info', 'warning', 'danger', 'bg', 'fg', 'selectbg', 'selectfg',
-                     'border', 'inputfg', 'inputbg'])
+        return iter(_ALL_COLOR_LABELS)
 
     @staticmethod
+    @lru_cache(maxsize=256)
     def hex_to_rgb(color):
         """Convert hexadecimal color to rgb color value
 
@@ -304,43 +410,38 @@ class Colors:
             color (str): param str color: hexadecimal color value
 
         Returns:
-            tuple[int, int, int]: rgb color value.
+            tuple[float, float, float]: rgb color value; each channel is in the range 0 to 1.
         """
         if len(color) == 4:
             # 3 digit hexadecimal colors
-            r = round(int(color[1], 16) / 255, 2)
-            g = round(int(color[2], 16) / 255, 2)
-            b = round(int(color[3], 16) / 255, 2)
+            value = int(color[1] * 2 + color[2] * 2 + color[3] * 2, 16)
         else:
             # 6 digit hexadecimal colors
-            r = round(int(color[1:3], 16) / 255, 2)
-            g = round(int(color[3:5], 16) / 255, 2)
-            b = round(int(color[5:], 16) / 255, 2)
-        return r, g, b
+            value = int(color[1:], 16)
+        return (value >> 16) / 255, (value >> 8 & 0xFF) / 255, (value & 0xFF) / 255
 
     @staticmethod
+    @lru_cache(maxsize=256)
     def rgb_to_hex(r, g, b):
         """Convert rgb to hexadecimal color value
 
         Args:
-            r (int): red
-            g (int): green
-            b (int): blue
+            r (float): red; in the range 0 to 1
+            g (float): green; in the range 0 to 1
+            b (float): blue; in the range 0 to 1
 
         Returns:
             str: a hexadecimal colorl value
         """
-        r_ = int(r * 255)
-        g_ = int(g * 255)
-        b_ = int(b * 255)
-        return '#{:02x}{:02x}{:02x}'.format(r_, g_, b_)
+        return f'#{int(r * 255 + 0.5):02x}{int(g * 255 + 0.5):02x}{int(b * 255 + 0.5):02x}'
 
     @staticmethod
+    @lru_cache(maxsize=256)
     def update_hsv(color, hd=0, sd=0, vd=0):
         """Modify the hue, saturation, and/or value of a given hex color value.
 
         Args:
-            color (str): the hexadecimal color value that is the target of hsv changes.
+            color (str): the hexadecimal color value or color name that is the target of hsv changes.
             hd (float): % change in hue
             sd (float): % change in saturation
             vd (float): % change in value
@@ -348,36 +449,42 @@ class Colors:
         Returns:
             str: a new hexadecimal color value that results from the hsv arguments passed into the function
         """
-        r, g, b = Colors.hex_to_rgb(color)
+        r, g, b = _color_to_rgb(color)
         h, s, v = colorsys.rgb_to_hsv(r, g, b)
 
-        # hue
-        if h * (1 + hd) > 1:
-            h = 1
-        elif h * (1 + hd) < 0:
-            h = 0
-        else:
-            h *= (1 + hd)
+        # hue and saturation are clamped to [0, 1]
+        h = min(1, max(0, h * (1 + hd)))
+        s = min(1, max(0, s * (1 + sd)))
 
-        # saturation
-        if s * (1 + sd) > 1:
-            s = 1
-        elif s * (1 + sd) < 0:
-            s = 0
-        else:
-            s *= (1 + sd)
-
-        # value
-        if v * (1 + vd) > 1:
-            v = 0.95
-        elif v * (1 + vd) < 0.05:
-            v = 0.05
-        else:
-            v *= (1 + vd)
+        # value is pulled back from the extremes so that the result is never pure black or white
+        v *= (1 + vd)
+        v = 0.95 if v > 1 else 0.05 if v < 0.05 else v
 
         r, g, b = colorsys.hsv_to_rgb(h, s, v)
         return Colors.rgb_to_hex(r, g, b)
 
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def scale_value(color, factor):
+        """Scale the value (brightness) of a color while keeping its hue and saturation.
+
+        When only the value changes, the hsv round trip reduces to scaling each rgb channel by the same factor, so the
+        conversion is skipped unless the result would be clamped. In that case, the result is the same as
+        ``update_hsv(color, vd=factor - 1)``.
+
+        Args:
+            color (str): the hexadecimal color value or color name to scale.
+            factor (float): the multiplier applied to the value; ie. 0.8 is 20% darker.
+
+        Returns:
+            str: a new hexadecimal color value.
+        """
+        r, g, b = _color_to_rgb(color)
+        v = max(r, g, b) * factor
+        if v > 1 or v < 0.05:
+            return Colors.update_hsv(color, vd=factor - 1)
+        return Colors.rgb_to_hex(r * factor, g * factor, b * factor)
+
 
 class StylerTK:
     """A class for styling tkinter widgets (not ttk).
@@ -577,6 +684,9 @@ class StylerTTK:
         styler_tk (StylerTk): an object used to style tkinter widgets (not ttk).
         theme (ThemeDefinition): the theme settings defined in the `themes.json` file.
     """
+    # checkbutton images shared between themes with the same colors; keyed by style and then by image colors. The
+    # images of a style are released with the style.
+    _checkbutton_images = weakref.WeakKeyDictionary()
 
     def __init__(self, style, definition):
         """
@@ -914,7 +1024,7 @@ class StylerTTK:
         im = Image.new('RGBA', (100, 100))
         draw = ImageDraw.Draw(im)
         draw.ellipse((0, 0, 95, 95), fill=color)
-        return ImageTk.PhotoImage(im.resize((size, size), Image.LANCZOS))
+        return ImageTk.PhotoImage(im.resize((size, size), Image.LANCZOS, reducing_gap=3.0))
 
     def _style_scale(self):
         """Create style configuration for ttk scale: *ttk.Scale*
@@ -997,8 +1107,7 @@ class StylerTTK:
     def _create_scrollbar_images(self):
         """Create assets needed for scrollbar arrows. The assets are saved to the ``theme_images`` property."""
         font_size = 13
-        with importlib.resources.open_binary('ttkbootstrap', 'Symbola.ttf') as font_path:
-            fnt = ImageFont.truetype(font_path, font_size)
+        fnt = _symbola_font(font_size)
 
         # up arrow
         vs_upim = Image.new('RGBA', (font_size, font_size))
@@ -1626,10 +1735,12 @@ class StylerTTK:
         draw.rectangle([18, 18, 110, 110], fill=disabled_fg)
 
         images = {}
-        images[f'{colorname}_squaretoggle_on'] = ImageTk.PhotoImage(toggle_on.resize((24, 15), Image.LANCZOS))
-        images[f'{colorname}_squaretoggle_off'] = ImageTk.PhotoImage(toggle_off.resize((24, 15), Image.LANCZOS))
+        images[f'{colorname}_squaretoggle_on'] = ImageTk.PhotoImage(
+            toggle_on.resize((24, 15), Image.LANCZOS, reducing_gap=3.0))
+        images[f'{colorname}_squaretoggle_off'] = ImageTk.PhotoImage(
+            toggle_off.resize((24, 15), Image.LANCZOS, reducing_gap=3.0))
         images[f'{colorname}_squaretoggle_disabled'] = ImageTk.PhotoImage(
-            toggle_disabled.resize((24, 15), Image.LANCZOS))
+            toggle_disabled.resize((24, 15), Image.LANCZOS, reducing_gap=3.0))
         return images
 
     def _create_roundtoggle_image(self, colorname):
@@ -1669,10 +1780,12 @@ class StylerTTK:
         draw.ellipse([20, 18, 112, 110], fill=disabled_fg)
 
         images = {}
-        images[f'{colorname}_roundtoggle_on'] = ImageTk.PhotoImage(toggle_on.resize((24, 15), Image.LANCZOS))
-        images[f'{colorname}_roundtoggle_off'] = ImageTk.PhotoImage(toggle_off.resize((24, 15), Image.LANCZOS))
+        images[f'{colorname}_roundtoggle_on'] = ImageTk.PhotoImage(
+            toggle_on.resize((24, 15), Image.LANCZOS, reducing_gap=3.0))
+        images[f'{colorname}_roundtoggle_off'] = ImageTk.PhotoImage(
+            toggle_off.resize((24, 15), Image.LANCZOS, reducing_gap=3.0))
         images[f'{colorname}_roundtoggle_disabled'] = ImageTk.PhotoImage(
-            toggle_disabled.resize((24, 15), Image.LANCZOS))
+            toggle_disabled.resize((24, 15), Image.LANCZOS, reducing_gap=3.0))
         return images
 
     def _style_roundtoggle_toolbutton(self):
@@ -2145,9 +2258,10 @@ class StylerTTK:
         draw.ellipse([2, 2, 132, 132], outline=disabled_fg, width=3, fill=off_fill)
 
         return {
-            f'{colorname}_radio_off': ImageTk.PhotoImage(radio_off.resize((14, 14), Image.LANCZOS)),
-            f'{colorname}_radio_on': ImageTk.PhotoImage(radio_on.resize((14, 14), Image.LANCZOS)),
-            f'{colorname}_radio_disabled': ImageTk.PhotoImage(radio_disabled.resize((14, 14), Image.LANCZOS))}
+            f'{colorname}_radio_off': ImageTk.PhotoImage(radio_off.resize((14, 14), Image.LANCZOS, reducing_gap=3.0)),
+            f'{colorname}_radio_on': ImageTk.PhotoImage(radio_on.resize((14, 14), Image.LANCZOS, reducing_gap=3.0)),
+            f'{colorname}_radio_disabled': ImageTk.PhotoImage(
+                radio_disabled.resize((14, 14), Image.LANCZOS, reducing_gap=3.0))}
 
     def _style_calendar(self):
         """Create style configuration for the ttkbootstrap.widgets.datechooser
@@ -2444,7 +2558,8 @@ class StylerTTK:
                             ('active !disabled', Colors.update_hsv(self.theme.colors.get(color), vd=-0.2))]}}})
 
     def _create_checkbutton_images(self, colorname):
-        """Create radiobutton assets
+        """Create checkbutton assets. Images are cached by color, so a theme or color variation that uses the same
+        colors as one that has already been created will reuse the existing images.
 
         Args:
             colorname (str): the name of the color to use for the button on state
@@ -2454,7 +2569,6 @@ class StylerTTK:
         """
         prime_color = self.theme.colors.get(colorname)
         on_border = prime_color
-        on_indicator = self.theme.colors.selectbg
         on_fill = prime_color
         off_border = self.theme.colors.selectbg
         off_fill = self.theme.colors.inputbg if self.theme.type == 'light' else self.theme.colors.selectfg
@@ -2462,31 +2576,39 @@ class StylerTTK:
                        Colors.update_hsv(self.theme.colors.inputbg, vd=-0.3))
         disabled_bg = self.theme.colors.inputbg if self.theme.type == 'light' else disabled_fg
 
-        # checkbutton off
-        checkbutton_off = Image.new('RGBA', (134, 134))
-        draw = ImageDraw.Draw(checkbutton_off)
-        draw.rounded_rectangle([2, 2, 132, 132], radius=16, outline=off_border, width=3, fill=off_fill)
+        cache = StylerTTK._checkbutton_images.setdefault(self.style, {})
+        key = (prime_color, off_border, off_fill, disabled_fg, disabled_bg, self.theme.colors.selectfg)
+        images = cache.get(key)
+
+        if images is None:
+            # the images are drawn at 4x the final size and reduced with a box filter, which keeps the edges smooth
+            # without the cost of resampling a much larger image.
 
-        # checkbutton on
-        with importlib.resources.open_binary('ttkbootstrap', 'Symbola.ttf') as font_path:
-            fnt = ImageFont.truetype(font_path, 130)
-        checkbutton_on = Image.new('RGBA', (134, 134))
-        draw = ImageDraw.Draw(checkbutton_on)
-        draw.rounded_rectangle([2, 2, 132, 132], radius=16, fill=on_fill, outline=on_border, width=3)
-        draw.text((20, 8), "✓", font=fnt, fill=self.theme.colors.selectfg)
+            # checkbutton off
+            checkbutton_off = Image.new('RGBA', (56, 56))
+            draw = ImageDraw.Draw(checkbutton_off)
+            draw.rounded_rectangle([1, 1, 55, 55], radius=7, outline=off_border, width=1, fill=off_fill)
 
-        # checkbutton disabled
-        checkbutton_disabled = Image.new('RGBA', (134, 134))
-        draw = ImageDraw.Draw(checkbutton_disabled)
-        draw.rounded_rectangle([2, 2, 132, 132], radius=16, outline=disabled_fg, width=3, fill=disabled_bg)
+            # checkbutton on
+            checkbutton_on = Image.new('RGBA', (56, 56))
+            draw = ImageDraw.Draw(checkbutton_on)
+            draw.rounded_rectangle([1, 1, 55, 55], radius=7, fill=on_fill, outline=on_border, width=1)
+            draw.text((8, 2), "✓", font=_symbola_font(55), fill=self.theme.colors.selectfg)
+
+            # checkbutton disabled
+            checkbutton_disabled = Image.new('RGBA', (56, 56))
+            draw = ImageDraw.Draw(checkbutton_disabled)
+            draw.rounded_rectangle([1, 1, 55, 55], radius=7, outline=disabled_fg, width=1, fill=disabled_bg)
+
+            images = (ImageTk.PhotoImage(checkbutton_off.resize((14, 14), Image.BOX)),
+                      ImageTk.PhotoImage(checkbutton_on.resize((14, 14), Image.BOX)),
+                      ImageTk.PhotoImage(checkbutton_disabled.resize((14, 14), Image.BOX)))
+            cache[key] = images
 
         return {
-            f'{colorname}_checkbutton_off':
-                ImageTk.PhotoImage(checkbutton_off.resize((14, 14), Image.LANCZOS)),
-            f'{colorname}_checkbutton_on':
-                ImageTk.PhotoImage(checkbutton_on.resize((14, 14), Image.LANCZOS)),
-            f'{colorname}_checkbutton_disabled':
-                ImageTk.PhotoImage(checkbutton_disabled.resize((14, 14), Image.LANCZOS))}
+            f'{colorname}_checkbutton_off': images[0],
+            f'{colorname}_checkbutton_on': images[1],
+            f'{colorname}_checkbutton_disabled': images[2]}
 
     def _style_solid_menubutton(self):
         """Apply a solid color style to ttk menubutton: *ttk.Menubutton*
@@ -2504,85 +2626,34 @@ class StylerTTK:
         disabled_fg = self.theme.colors.inputfg
         disabled_bg = (Colors.update_hsv(self.theme.colors.inputbg, vd=-0.2) if self.theme.type == 'light' else
                        Colors.update_hsv(self.theme.colors.inputbg, vd=-0.3))
+        arrowcolor = self.theme.colors.bg if self.theme.type == 'light' else 'white'
 
         # pressed and hover settings
-        pressed_vd = -0.2
-        hover_vd = -0.1
+        pressed_factor = 0.8
+        hover_factor = 0.9
 
-        self.settings.update({
-            'TMenubutton': {
-                'configure': {
+        styles = [('TMenubutton', self.theme.colors.primary)]
+        styles += [(f'{color}.TMenubutton', self.theme.colors.get(color)) for color in self.theme.colors]
+
+        for ttkstyle, color in styles:
+            pressed_bg = Colors.scale_value(color, pressed_factor)
+            hover_bg = Colors.scale_value(color, hover_factor)
+            self.settings[ttkstyle] = _menubutton_settings(
+                configure={
                     'foreground': self.theme.colors.selectfg,
-                    'background': self.theme.colors.primary,
-                    'bordercolor': self.theme.colors.primary,
-                    'darkcolor': self.theme.colors.primary,
-                    'lightcolor': self.theme.colors.primary,
+                    'background': color,
+                    'bordercolor': color,
+                    'darkcolor': color,
+                    'lightcolor': color,
                     'arrowsize': 4,
-                    'arrowcolor': self.theme.colors.bg if self.theme.type == 'light' else 'white',
-                    'arrowpadding': (0, 0, 15, 0),
-                    'relief': 'raised',
-                    'focusthickness': 0,
-                    'focuscolor': '',
-                    'padding': (10, 5)},
-                'map': {
-                    'arrowcolor': [
-                        ('disabled', disabled_fg)],
-                    'foreground': [
-                        ('disabled', disabled_fg)],
-                    'background': [
-                        ('disabled', disabled_bg),
-                        ('pressed !disabled', Colors.update_hsv(self.theme.colors.primary, vd=pressed_vd)),
-                        ('hover !disabled', Colors.update_hsv(self.theme.colors.primary, vd=hover_vd))],
-                    'bordercolor': [
-                        ('disabled', disabled_bg),
-                        ('pressed !disabled', Colors.update_hsv(self.theme.colors.primary, vd=pressed_vd)),
-                        ('hover !disabled', Colors.update_hsv(self.theme.colors.primary, vd=hover_vd))],
-                    'darkcolor': [
-                        ('disabled', disabled_bg),
-                        ('pressed !disabled', Colors.update_hsv(self.theme.colors.primary, vd=pressed_vd)),
-                        ('hover !disabled', Colors.update_hsv(self.theme.colors.primary, vd=hover_vd))],
-                    'lightcolor': [
-                        ('disabled', disabled_bg),
-                        ('pressed !disabled', Colors.update_hsv(self.theme.colors.primary, vd=pressed_vd)),
-                        ('hover !disabled', Colors.update_hsv(self.theme.colors.primary, vd=hover_vd))]}}})
-
-        for color in self.theme.colors:
-            self.settings.update({
-                f'{color}.TMenubutton': {
-                    'configure': {
-                        'foreground': self.theme.colors.selectfg,
-                        'background': self.theme.colors.get(color),
-                        'bordercolor': self.theme.colors.get(color),
-                        'darkcolor': self.theme.colors.get(color),
-                        'lightcolor': self.theme.colors.get(color),
-                        'arrowsize': 4,
-                        'arrowcolor': self.theme.colors.bg if self.theme.type == 'light' else 'white',
-                        'arrowpadding': (0, 0, 15, 0),
-                        'relief': 'raised',
-                        'focusthickness': 0,
-                        'focuscolor': '',
-                        'padding': (10, 5)},
-                    'map': {
-                        'arrowcolor': [
-                            ('disabled', disabled_fg)],
-                        'foreground': [
-                            ('disabled', disabled_fg)],
-                        'background': [
-                            ('disabled', disabled_bg),
-                            ('pressed !disabled', Colors.update_hsv(self.theme.colors.get(color), vd=pressed_vd)),
-                            ('hover !disabled', Colors.update_hsv(self.theme.colors.get(color), vd=hover_vd))],
-                        'bordercolor': [
-                            ('disabled', disabled_bg),
-                            ('pressed !disabled', Colors.update_hsv(self.theme.colors.get(color), vd=pressed_vd)),
-                            ('hover !disabled', Colors.update_hsv(self.theme.colors.get(color), vd=hover_vd))],
-                        'darkcolor': [
-                            ('disabled', disabled_bg),
-                            ('pressed !disabled', Colors.update_hsv(self.theme.colors.get(color), vd=pressed_vd)),
-                            ('hover !disabled', Colors.update_hsv(self.theme.colors.get(color), vd=hover_vd))],
-                        'lightcolor': [
-                            ('disabled', disabled_bg),
-                            ('pressed !disabled', Colors.update_hsv(self.theme.colors.get(color), vd=pressed_vd)),
-                            ('hover !disabled', Colors.update_hsv(self.theme.colors.get(color), vd=hover_vd))]}}})
+                    'arrowcolor': arrowcolor},
+                state_colors={
+                    'arrowcolor': (disabled_fg, None, None),
+                    'foreground': (disabled_fg, None, None),
+                    'background': (disabled_bg, pressed_bg, hover_bg),
+                    'bordercolor': (disabled_bg, pressed_bg, hover_bg),
+                    'darkcolor': (disabled_bg, pressed_bg, hover_bg),
+                    'lightcolor': (disabled_bg, pressed_bg, hover_bg)})
 
     def _style_outline_menubutton(self):
         """Apply and outline style to ttk menubutton: *ttk.Menubutton*
@@ -2599,86 +2670,35 @@ class StylerTTK:
         # disabled settings
         disabled_fg = (Colors.update_hsv(self.theme.colors.inputbg, vd=-0.2) if self.theme.type == 'light' else
                        Colors.update_hsv(self.theme.colors.inputbg, vd=-0.3))
+        selectfg = self.theme.colors.selectfg
 
         # pressed and hover settings
-        pressed_vd = -0.2
-        hover_vd = -0.1
-
-        self.settings.update({
-            'Outline.TMenubutton': {
-                'configure': {
-                    'font': self.theme.font,
-                    'foreground': self.theme.colors.primary,
-                    'background': self.theme.colors.bg,
-                    'bordercolor': self.theme.colors.primary,
-                    'darkcolor': self.theme.colors.bg,
-                    'lightcolor': self.theme.colors.bg,
-                    'arrowcolor': self.theme.colors.primary,
-                    'arrowpadding': (0, 0, 15, 0),
-                    'relief': 'raised',
-                    'focusthickness': 0,
-                    'focuscolor': '',
-                    'padding': (10, 5)},
-                'map': {
-                    'foreground': [
-                        ('disabled', disabled_fg),
-                        ('pressed !disabled', self.theme.colors.selectfg),
-                        ('hover !disabled', self.theme.colors.selectfg)],
-                    'background': [
-                        ('pressed !disabled', Colors.update_hsv(self.theme.colors.primary, vd=pressed_vd)),
-                        ('hover !disabled', Colors.update_hsv(self.theme.colors.primary, vd=hover_vd))],
-                    'bordercolor': [
-                        ('disabled', disabled_fg),
-                        ('pressed !disabled', Colors.update_hsv(self.theme.colors.primary, vd=pressed_vd)),
-                        ('hover !disabled', Colors.update_hsv(self.theme.colors.primary, vd=hover_vd))],
-                    'darkcolor': [
-                        ('pressed !disabled', Colors.update_hsv(self.theme.colors.primary, vd=pressed_vd)),
-                        ('hover !disabled', Colors.update_hsv(self.theme.colors.primary, vd=hover_vd))],
-                    'lightcolor': [
-                        ('pressed !disabled', Colors.update_hsv(self.theme.colors.primary, vd=pressed_vd)),
-                        ('hover !disabled', Colors.update_hsv(self.theme.colors.primary, vd=hover_vd))],
-                    'arrowcolor': [
-                        ('disabled', disabled_fg),
-                        ('pressed !disabled', self.theme.colors.selectfg),
-                        ('hover !disabled', self.theme.colors.selectfg)]}}})
-
-        for color in self.theme.colors:
-            self.settings.update({
-                f'{color}.Outline.TMenubutton': {
-                    'configure': {
-                        'foreground': self.theme.colors.get(color),
-                        'background': self.theme.colors.bg,
-                        'bordercolor': self.theme.colors.get(color),
-                        'darkcolor': self.theme.colors.bg,
-                        'lightcolor': self.theme.colors.bg,
-                        'arrowcolor': self.theme.colors.get(color),
-                        'arrowpadding': (0, 0, 15, 0),
-                        'relief': 'raised',
-                        'focusthickness': 0,
-                        'focuscolor': '',
-                        'padding': (10, 5)},
-                    'map': {
-                        'foreground': [
-                            ('disabled', disabled_fg),
-                            ('pressed !disabled', self.theme.colors.selectfg),
-                            ('hover !disabled', self.theme.colors.selectfg)],
-                        'background': [
-                            ('pressed !disabled', Colors.update_hsv(self.theme.colors.get(color), vd=pressed_vd)),
-                            ('hover !disabled', Colors.update_hsv(self.theme.colors.get(color), vd=hover_vd))],
-                        'bordercolor': [
-                            ('disabled', disabled_fg),
-                            ('pressed !disabled', Colors.update_hsv(self.theme.colors.get(color), vd=pressed_vd)),
-                            ('hover !disabled', Colors.update_hsv(self.theme.colors.get(color), vd=hover_vd))],
-                        'darkcolor': [
-                            ('pressed !disabled', Colors.update_hsv(self.theme.colors.get(color), vd=pressed_vd)),
-                            ('hover !disabled', Colors.update_hsv(self.theme.colors.get(color), vd=hover_vd))],
-                        'lightcolor': [
-                            ('pressed !disabled', Colors.update_hsv(self.theme.colors.get(color), vd=pressed_vd)),
-                            ('hover !disabled', Colors.update_hsv(self.theme.colors.get(color), vd=hover_vd))],
-                        'arrowcolor': [
-                            ('disabled', disabled_fg),
-                            ('pressed !disabled', self.theme.colors.selectfg),
-                            ('hover !disabled', self.theme.colors.selectfg)]}}})
+        pressed_factor = 0.8
+        hover_factor = 0.9
+
+        styles = [('Outline.TMenubutton', self.theme.colors.primary)]
+        styles += [(f'{color}.Outline.TMenubutton', self.theme.colors.get(color)) for color in self.theme.colors]
+
+        for ttkstyle, color in styles:
+            pressed_bg = Colors.scale_value(color, pressed_factor)
+            hover_bg = Colors.scale_value(color, hover_factor)
+            configure = {'font': self.theme.font} if ttkstyle == 'Outline.TMenubutton' else {}
+            configure.update({
+                'foreground': color,
+                'background': self.theme.colors.bg,
+                'bordercolor': color,
+                'darkcolor': self.theme.colors.bg,
+                'lightcolor': self.theme.colors.bg,
+                'arrowcolor': color})
+            self.settings[ttkstyle] = _menubutton_settings(
+                configure=configure,
+                state_colors={
+                    'foreground': (disabled_fg, selectfg, selectfg),
+                    'background': (None, pressed_bg, hover_bg),
+                    'bordercolor': (disabled_fg, pressed_bg, hover_bg),
+                    'darkcolor': (None, pressed_bg, hover_bg),
+                    'lightcolor': (None, pressed_bg, hover_bg),
+                    'arrowcolor': (disabled_fg, selectfg, selectfg)})
 
     def _style_notebook(self):
         """Create style configuration for ttk notebook: *ttk.Notebook*
@@ -2778,13 +2798,5 @@ class StylerTTK:
         Args:
             colorname (str): the name of the color to use for the sizegrip images
         """
-        im = Image.new('RGBA', (14, 14))
-        draw = ImageDraw.Draw(im)
-        color = self.theme.colors.get(colorname)
-        draw.rectangle((9, 3, 10, 4), fill=color)  # top
-        draw.rectangle((6, 6, 7, 7), fill=color)  # middle
-        draw.rectangle((9, 6, 10, 7), fill=color)
-        draw.rectangle((3, 9, 4, 10), fill=color)  # bottom
-        draw.rectangle((6, 9, 7, 10), fill=color)
-        draw.rectangle((9, 9, 10, 10), fill=color)
+        im = Image.frombytes('RGBA', (14, 14), _sizegrip_image_data(self.theme.colors.get(colorname)))
         self.theme_images[f'{colorname}_sizegrip'] = ImageTk.PhotoImage(im)
@@ -3,6 +3,7 @@ Author: Israel Dryer
 License: MIT
 Copyright (c) 2021 Israel Dryer
 """
+from functools import partial
 from ttkbootstrap import Style
 import tkinter
 from tkinter import ttk
@@ -77,7 +78,7 @@ class Demo(Style):
         mb.menu = tkinter.Menu(mb)
         mb['menu'] = mb.menu
         for t in sorted(self._theme_definitions.keys()):
-            mb.menu.add_command(label=t, command=lambda theme_name=t: self.change_theme(theme_name))
+            mb.menu.add_command(label=t, command=partial(self.change_theme, t))
 
         # Separator
         ttk.Separator(tab, orient='horizontal').pack(fill='x', pady=(10, 15))
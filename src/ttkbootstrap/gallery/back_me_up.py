@@ -3,8 +3,11 @@
     Modified: 2021-04-23
     Adapted for ttkbootstrap from: http://www.leo-backup.com/screenshots.shtml
 """
+import os
 import tkinter
 from datetime import datetime
+from functools import partial
+from pathlib import Path
 from random import choices
 from tkinter import ttk
 from tkinter.filedialog import askdirectory
@@ -14,6 +17,40 @@ from tkinter.scrolledtext import ScrolledText
 from ttkbootstrap import Style
 
 
+# image assets, found relative to this script
+ASSETS = Path(__file__).resolve().parent / 'assets'
+
+# image name and asset file for each image used by the application
+IMAGE_FILES = {
+    'properties-dark': 'icons8_settings_24px.png',
+    'properties-light': 'icons8_settings_24px_2.png',
+    'add-to-backup-dark': 'icons8_add_folder_24px.png',
+    'add-to-backup-light': 'icons8_add_book_24px.png',
+    'stop-backup-dark': 'icons8_cancel_24px.png',
+    'stop-backup-light': 'icons8_cancel_24px_1.png',
+    'play': 'icons8_play_24px_1.png',
+    'refresh': 'icons8_refresh_24px_1.png',
+    'stop-dark': 'icons8_stop_24px.png',
+    'stop-light': 'icons8_stop_24px_1.png',
+    'opened-folder': 'icons8_opened_folder_24px.png',
+    'logo': 'backup.png',
+    'open': 'icons8_double_up_24px.png',
+    'closed': 'icons8_double_right_24px.png'}
+
+# check all image files with a single scan of the assets folder, so that a missing file fails before any widgets exist
+_missing_files = set(IMAGE_FILES.values()).difference(entry.name for entry in os.scandir(ASSETS))
+if _missing_files:
+    raise FileNotFoundError(f'missing image files in {ASSETS}: {", ".join(sorted(_missing_files))}')
+
+# text, image name, and message of each button on the buttonbar
+BUTTONBAR_BUTTONS = [
+    ('New backup set', 'add-to-backup-light', 'Adding new backup'),
+    ('Backup', 'play', 'Backing up...'),
+    ('Refresh', 'refresh', 'Refreshing...'),
+    ('Stop', 'stop-light', 'Stopping backup.'),
+    ('Settings', 'properties-light', 'Changing settings')]
+
+
 class Application(tkinter.Tk):
 
     def __init__(self):
@@ -30,49 +67,17 @@ class BackMeUp(ttk.Frame):
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-
-        # images
-        self.img_properties_d = tkinter.PhotoImage(name='properties-dark', file='assets/icons8_settings_24px.png')
-        self.img_properties_l = tkinter.PhotoImage(name='properties-light', file='assets/icons8_settings_24px_2.png')
-        self.img_addtobackup_d = tkinter.PhotoImage(name='add-to-backup-dark', file='assets/icons8_add_folder_24px.png')
-        self.img_addtobackup_l = tkinter.PhotoImage(name='add-to-backup-light', file='assets/icons8_add_book_24px.png')
-        self.img_stopbackup_d = tkinter.PhotoImage(name='stop-backup-dark', file='assets/icons8_cancel_24px.png')
-        self.img_stopbackup_l = tkinter.PhotoImage(name='stop-backup-light', file='assets/icons8_cancel_24px_1.png')
-        self.img_play = tkinter.PhotoImage(name='play', file='assets/icons8_play_24px_1.png')
-        self.img_refresh = tkinter.PhotoImage(name='refresh', file='assets/icons8_refresh_24px_1.png')
-        self.img_stop_d = tkinter.PhotoImage(name='stop-dark', file='assets/icons8_stop_24px.png')
-        self.img_stop_l = tkinter.PhotoImage(name='stop-light', file='assets/icons8_stop_24px_1.png')
-        self.img_opened_folder = tkinter.PhotoImage(name='opened-folder', file='assets/icons8_opened_folder_24px.png')
-        self.img_logo = tkinter.PhotoImage(name='logo', file='assets/backup.png')
+        self.images = {}  # the images loaded so far, by name
 
         # ----- buttonbar
         buttonbar = ttk.Frame(self, style='primary.TFrame')
         buttonbar.pack(fill='x', pady=1, side='top')
 
-        ## new backup
-        bb_new_backup_btn = ttk.Button(buttonbar, text='New backup set', image='add-to-backup-light', compound='left')
-        bb_new_backup_btn.configure(command=lambda: showinfo(message='Adding new backup'))
-        bb_new_backup_btn.pack(side='left', ipadx=5, ipady=5, padx=(1, 0), pady=1)
-
-        ## backup
-        bb_backup_btn = ttk.Button(buttonbar, text='Backup', image='play', compound='left')
-        bb_backup_btn.configure(command=lambda: showinfo(message='Backing up...'))
-        bb_backup_btn.pack(side='left', ipadx=5, ipady=5, padx=0, pady=1)
-
-        ## refresh
-        bb_refresh_btn = ttk.Button(buttonbar, text='Refresh', image='refresh', compound='left')
-        bb_refresh_btn.configure(command=lambda: showinfo(message='Refreshing...'))
-        bb_refresh_btn.pack(side='left', ipadx=5, ipady=5, padx=0, pady=1)
-
-        ## stop
-        bb_stop_btn = ttk.Button(buttonbar, text='Stop', image='stop-light', compound='left')
-        bb_stop_btn.configure(command=lambda: showinfo(message='Stopping backup.'))
-        bb_stop_btn.pack(side='left', ipadx=5, ipady=5, padx=0, pady=1)
-
-        ## settings
-        bb_settings_btn = ttk.Button(buttonbar, text='Settings', image='properties-light', compound='left')
-        bb_settings_btn.configure(command=lambda: showinfo(message='Changing settings'))
-        bb_settings_btn.pack(side='left', ipadx=5, ipady=5, padx=0, pady=1)
+        ## one button per entry of ``BUTTONBAR_BUTTONS``; the first button is offset from the window edge
+        for i, (text, image, message) in enumerate(BUTTONBAR_BUTTONS):
+            btn = ttk.Button(buttonbar, text=text, image=self.get_image(image), compound='left',
+                             command=partial(showinfo, message=message))
+            btn.pack(side='left', ipadx=5, ipady=5, padx=(1, 0) if i == 0 else 0, pady=1)
 
         # ----- left panel
         left_panel = ttk.Frame(self, style='bg.TFrame')
@@ -107,13 +112,14 @@ class BackMeUp(ttk.Frame):
         bus_sep.grid(row=3, column=0, columnspan=2, pady=10, sticky='ew')
 
         ## properties button
-        bus_prop_btn = ttk.Button(bus_frm, text='Properties', image='properties-dark', compound='left')
-        bus_prop_btn.configure(command=lambda: showinfo(message='Changing properties'), style='Link.TButton')
+        bus_prop_btn = ttk.Button(bus_frm, text='Properties', image=self.get_image('properties-dark'), compound='left',
+                                  command=partial(showinfo, message='Changing properties'), style='Link.TButton')
         bus_prop_btn.grid(row=4, column=0, columnspan=2, sticky='w')
 
         ## add to backup button
-        bus_add_btn = ttk.Button(bus_frm, text='Add to backup', image='add-to-backup-dark', compound='left')
-        bus_add_btn.configure(command=lambda: showinfo(message='Adding to backup'), style='Link.TButton')
+        bus_add_btn = ttk.Button(bus_frm, text='Add to backup', image=self.get_image('add-to-backup-dark'),
+                                 compound='left', command=partial(showinfo, message='Adding to backup'),
+                                 style='Link.TButton')
         bus_add_btn.grid(row=5, column=0, columnspan=2, sticky='w')
 
         # ----- backup status (collapsible)
@@ -152,8 +158,8 @@ class BackMeUp(ttk.Frame):
         status_sep.grid(row=5, column=0, columnspan=2, pady=10, sticky='ew')
 
         ## stop button
-        status_stop_btn = ttk.Button(status_frm, text='Stop', image='stop-backup-dark', compound='left')
-        status_stop_btn.configure(command=lambda: showinfo(message='Stopping backup'), style='Link.TButton')
+        status_stop_btn = ttk.Button(status_frm, text='Stop', image=self.get_image('stop-backup-dark'), compound='left',
+                                     command=partial(showinfo, message='Stopping backup'), style='Link.TButton')
         status_stop_btn.grid(row=6, column=0, columnspan=2, sticky='w')
 
         ## section separator
@@ -165,7 +171,7 @@ class BackMeUp(ttk.Frame):
         self.setvar('current-file-msg', 'Uploading file: d:/test/settings.txt')
 
         # logo
-        ttk.Label(left_panel, image='logo', style='bg.TLabel').pack(side='bottom')
+        ttk.Label(left_panel, image=self.get_image('logo'), style='bg.TLabel').pack(side='bottom')
 
         # ---- right panel
         right_panel = ttk.Frame(self, padding=(2, 1))
@@ -176,7 +182,7 @@ class BackMeUp(ttk.Frame):
         browse_frm.pack(side='top', fill='x', padx=2, pady=1)
         file_entry = ttk.Entry(browse_frm, textvariable='folder-path')
         file_entry.pack(side='left', fill='x', expand='yes')
-        open_btn = ttk.Button(browse_frm, image='opened-folder', style='secondary.Link.TButton',
+        open_btn = ttk.Button(browse_frm, image=self.get_image('opened-folder'), style='secondary.Link.TButton',
                               command=self.get_directory)
         open_btn.pack(side='right')
 
@@ -199,20 +205,40 @@ class BackMeUp(ttk.Frame):
         st.pack(fill='both', expand='yes')
         scroll_cf.add(output_container, textvariable='scroll-message')
 
-        # ----- seed with some sample data -----------------------------------------------------------------------------
+        # ----- seed with some sample data once the window has been drawn ----------------------------------------------
+        self.after_idle(self.seed_sample_data, tv, st, file_entry)
+
+    def seed_sample_data(self, tv, st, file_entry):
+        """Fill the widgets with sample data
 
+        :param ttk.Treeview tv: the backup file treeview
+        :param ScrolledText st: the backup log
+        :param ttk.Entry file_entry: the backup directory entry
+        """
         ## starting sample directory
         file_entry.insert('end', 'D:/text/myfiles/top-secret/samples/')
 
-        ## treeview and backup logs
-        for x in range(20, 35):
-            result = choices(['Backup Up', 'Missed in Destination'])[0]
-            st.insert('end', f'19:34:{x}\t\t Uploading file: D:/text/myfiles/top-secret/samples/sample_file_{x}.txt\n')
-            st.insert('end', f'19:34:{x}\t\t Upload {result}.\n')
-            timestamp = datetime.now().strftime('%d.%m.%Y %H:%M:%S')
+        ## treeview and backup logs; the log text is inserted with a single call after the loop
+        timestamp = datetime.now().strftime('%d.%m.%Y %H:%M:%S')
+        results = choices(['Backup Up', 'Missed in Destination'], k=15)
+        log = []
+        for x, result in zip(range(20, 35), results):
+            log.append(f'19:34:{x}\t\t Uploading file: D:/text/myfiles/top-secret/samples/sample_file_{x}.txt\n')
+            log.append(f'19:34:{x}\t\t Upload {result}.\n')
             tv.insert('', 'end', x, values=(f'sample_file_{x}.txt', result, timestamp, timestamp, f'{int(x // 3)} MB'))
+        st.insert('end', ''.join(log))
         tv.selection_set(20)
 
+    def get_image(self, name):
+        """Get the named image, loading it from the assets folder the first time it is requested
+
+        :param str name: the image name; a key of ``IMAGE_FILES``
+        """
+        image = self.images.get(name)
+        if image is None:
+            image = self.images[name] = tkinter.PhotoImage(name=name, file=ASSETS / IMAGE_FILES[name])
+        return image
+
     def get_directory(self):
         """Open dialogue to get directory and update directory variable"""
         self.update_idletasks()
@@ -225,13 +251,14 @@ class CollapsingFrame(ttk.Frame):
     """
     A collapsible frame widget that opens and closes with a button click.
     """
+    # header frame and label styles for each toggle button style
+    header_style_cache = {}
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.columnconfigure(0, weight=1)
         self.cumulative_rows = 0
-        self.images = [tkinter.PhotoImage(name='open', file='assets/icons8_double_up_24px.png'),
-                       tkinter.PhotoImage(name='closed', file='assets/icons8_double_right_24px.png')]
+        self.images = None
 
     def add(self, child, title="", style='primary.TButton', **kwargs):
         """Add a child to the collapsible frame
@@ -242,18 +269,22 @@ class CollapsingFrame(ttk.Frame):
         """
         if child.winfo_class() != 'TFrame':  # must be a frame
             return
-        style_color = style.split('.')[0]
-        frm = ttk.Frame(self, style=f'{style_color}.TFrame')
+        # the toggle images are loaded when the first section is added
+        if self.images is None:
+            self.images = [tkinter.PhotoImage(name='open', file=ASSETS / IMAGE_FILES['open']),
+                           tkinter.PhotoImage(name='closed', file=ASSETS / IMAGE_FILES['closed'])]
+        frame_style, label_style = self._header_styles(style)
+        frm = ttk.Frame(self, style=frame_style)
         frm.grid(row=self.cumulative_rows, column=0, sticky='ew')
 
         # header title
-        lbl = ttk.Label(frm, text=title, style=f'{style_color}.Inverse.TLabel')
+        lbl = ttk.Label(frm, text=title, style=label_style)
         if kwargs.get('textvariable'):
             lbl.configure(textvariable=kwargs.get('textvariable'))
         lbl.pack(side='left', fill='both', padx=10)
 
         # header toggle button
-        btn = ttk.Button(frm, image='open', style=style, command=lambda c=child: self._toggle_open_close(child))
+        btn = ttk.Button(frm, image='open', style=style, command=partial(self._toggle_open_close, child))
         btn.pack(side='right')
 
         # assign toggle button to child so that it's accesible when toggling (need to change image)
@@ -263,6 +294,19 @@ class CollapsingFrame(ttk.Frame):
         # increment the row assignment
         self.cumulative_rows += 2
 
+    @classmethod
+    def _header_styles(cls, style):
+        """Get the frame and label styles of a section header that matches the button style; the style names are
+        built once for each button style and shared by all instances
+
+        :param str style: the ttk style of the header toggle button
+        """
+        styles = cls.header_style_cache.get(style)
+        if styles is None:
+            style_color = style.split('.')[0]
+            styles = cls.header_style_cache[style] = (f'{style_color}.TFrame', f'{style_color}.Inverse.TLabel')
+        return styles
+
     def _toggle_open_close(self, child):
         """
         Open or close the section and change the toggle button image accordingly
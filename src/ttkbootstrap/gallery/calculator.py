@@ -2,6 +2,7 @@
     Author: Israel Dryer
     Modified: 2021-04-09
 """
+import operator
 import tkinter
 from tkinter import ttk
 
@@ -21,6 +22,10 @@ class Application(tkinter.Tk):
 
 class Calculator(ttk.Frame):
 
+    # the arithmetic operation of each operator key, and the keys that clear the calculator
+    OPERATIONS = {'/': operator.truediv, '*': operator.mul, '-': operator.sub, '+': operator.add}
+    CLEAR_KEYS = frozenset(('CE', 'C'))
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.configure(padding=1)
@@ -30,56 +35,70 @@ class Calculator(ttk.Frame):
         self.display = ttk.Label(self, textvariable=self.display_var, font='TkFixedFont 20', anchor='e')
         self.display.grid(row=0, column=0, columnspan=4, sticky='ew', pady=15, padx=10)
 
-        # button layout
+        # button layout; the label and style of each button, four buttons per row
         button_matrix = [
-            ('%', 'C', 'CE', '/'), (7, 8, 9, '*'), (4, 5, 6, '-'), (1, 2, 3, '+'), ('±', 0, '.', '=')]
+            ('%', 'secondary'), ('C', 'secondary'), ('CE', 'secondary'), ('/', 'secondary'),
+            (7, 'primary'), (8, 'primary'), (9, 'primary'), ('*', 'secondary'),
+            (4, 'primary'), (5, 'primary'), (6, 'primary'), ('-', 'secondary'),
+            (1, 'primary'), (2, 'primary'), (3, 'primary'), ('+', 'secondary'),
+            ('±', 'secondary'), (0, 'primary'), ('.', 'secondary'), ('=', 'success')]
 
         # create buttons with various styling
-        for i, row in enumerate(button_matrix):
-            for j, lbl in enumerate(row):
-                if isinstance(lbl, int):
-                    btn = ttk.Button(self, text=lbl, width=2, style='primary.TButton')
-                elif lbl == '=':
-                    btn = ttk.Button(self, text=lbl, width=2, style='success.TButton')
-                else:
-                    btn = ttk.Button(self, text=lbl, width=2, style='secondary.TButton')
-                btn.grid(row=i + 1, column=j, sticky='nsew', padx=1, pady=1, ipadx=10, ipady=10)
-
-                # bind button press
-                btn.bind("<Button-1>", self.press_button)
+        for index, (lbl, color) in enumerate(button_matrix):
+            i, j = divmod(index, 4)
+            btn = ttk.Button(self, text=lbl, width=2, style=f'{color}.TButton')
+            btn.grid(row=i + 1, column=j, sticky='nsew', padx=1, pady=1, ipadx=10, ipady=10)
+
+            # bind button press
+            btn.bind("<Button-1>", self.press_button)
+
+        # handler for each button value; buttons without a handler only refresh the display
+        self.key_handlers = {'.': self.press_decimal, '=': self.press_equals}
+        self.key_handlers.update((n, self.press_number) for n in range(10))
+        self.key_handlers.update((key, self.press_operator) for key in self.OPERATIONS)
+        self.key_handlers.update((key, self.press_clear) for key in self.CLEAR_KEYS)
 
         # variables used for collecting button input
         self.position_left = ''
         self.position_right = '0'
         self.position_is_left = True
         self.running_total = 0.0
+        self.operator = None
 
     def press_button(self, event):
         value = event.widget['text']
-
-        if isinstance(value, int):
-            if self.position_is_left:
-                self.position_left = f'{self.position_left}{value}'
-            else:
-                self.position_right = str(value) if self.position_right == '0' else f'{self.position_right}{value}'
-        elif value == '.':
-            self.position_is_left = False
-        elif value in ['/', '-', '+', '*']:
-            self.operator = value
-            self.running_total = float(self.display_var.get())
-            self.reset_variables()
-        elif value == '=':
-            operation = f'{self.running_total}{self.operator}{self.display_var.get()}'
-            result = eval(operation)
-            self.display_var.set(result)
-            return
-        elif value in ['CE', 'C']:
-            self.reset_variables()
-            self.operator = None
-            self.running_total = 0
+        self.key_handlers.get(value, self.update_display)(value)
+
+    def press_number(self, value):
+        if self.position_is_left:
+            self.position_left = f'{self.position_left}{value}'
+        else:
+            self.position_right = str(value) if self.position_right == '0' else f'{self.position_right}{value}'
+        self.update_display()
+
+    def press_decimal(self, value):
+        self.position_is_left = False
+        self.update_display()
+
+    def press_operator(self, value):
+        self.operator = value
+        self.running_total = float(self.display_var.get())
+        self.reset_variables()
+        self.update_display()
+
+    def press_equals(self, value):
+        operation = self.OPERATIONS.get(self.operator)
+        if operation is None:
             return
+        self.display_var.set(operation(self.running_total, float(self.display_var.get())))
+
+    def press_clear(self, value):
+        self.reset_variables()
+        self.operator = None
+        self.running_total = 0
 
-        # update the number display
+    def update_display(self, *_):
+        """Update the number display from the digits collected on each side of the decimal point"""
         self.display_var.set('.'.join([self.position_left, self.position_right]))
 
     def reset_variables(self):
@@ -3,11 +3,16 @@
     Modified: 2021-04-08
 """
 import tkinter
+from functools import partial
+from pathlib import Path
 from tkinter import ttk
 
 from ttkbootstrap import Style
 
 
+ASSETS = Path(__file__).resolve().parent / 'assets'
+
+
 class Application(tkinter.Tk):
 
     def __init__(self):
@@ -41,13 +46,14 @@ class CollapsingFrame(ttk.Frame):
     """
     A collapsible frame widget that opens and closes with a button click.
     """
+    # header frame and label styles for each toggle button style
+    header_style_cache = {}
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.columnconfigure(0, weight=1)
         self.cumulative_rows = 0
-        self.images = [tkinter.PhotoImage(name='open', file='assets/icons8_double_up_24px.png'),
-                       tkinter.PhotoImage(name='closed', file='assets/icons8_double_right_24px.png')]
+        self.images = None
 
     def add(self, child, title="", style='primary.TButton', **kwargs):
         """Add a child to the collapsible frame
@@ -58,18 +64,22 @@ class CollapsingFrame(ttk.Frame):
         """
         if child.winfo_class() != 'TFrame':  # must be a frame
             return
-        style_color = style.split('.')[0]
-        frm = ttk.Frame(self, style=f'{style_color}.TFrame')
+        # the toggle images are loaded when the first section is added
+        if self.images is None:
+            self.images = [tkinter.PhotoImage(name='open', file=ASSETS / 'icons8_double_up_24px.png'),
+                           tkinter.PhotoImage(name='closed', file=ASSETS / 'icons8_double_right_24px.png')]
+        frame_style, label_style = self._header_styles(style)
+        frm = ttk.Frame(self, style=frame_style)
         frm.grid(row=self.cumulative_rows, column=0, sticky='ew')
 
         # header title
-        lbl = ttk.Label(frm, text=title, style=f'{style_color}.Invert.TLabel')
+        lbl = ttk.Label(frm, text=title, style=label_style)
         if kwargs.get('textvariable'):
             lbl.configure(textvariable=kwargs.get('textvariable'))
         lbl.pack(side='left', fill='both', padx=10)
 
         # header toggle button
-        btn = ttk.Button(frm, image='open', style=style, command=lambda c=child: self._toggle_open_close(child))
+        btn = ttk.Button(frm, image='open', style=style, command=partial(self._toggle_open_close, child))
         btn.pack(side='right')
 
         # assign toggle button to child so that it's accesible when toggling (need to change image)
@@ -79,6 +89,19 @@ class CollapsingFrame(ttk.Frame):
         # increment the row assignment
         self.cumulative_rows += 2
 
+    @classmethod
+    def _header_styles(cls, style):
+        """Get the frame and label styles of a section header that matches the button style; the style names are
+        built once for each button style and shared by all instances
+
+        :param str style: the ttk style of the header toggle button
+        """
+        styles = cls.header_style_cache.get(style)
+        if styles is None:
+            style_color = style.split('.')[0]
+            styles = cls.header_style_cache[style] = (f'{style_color}.TFrame', f'{style_color}.Invert.TLabel')
+        return styles
+
     def _toggle_open_close(self, child):
         """
         Open or close the section and change the toggle button image accordingly
@@ -3,6 +3,7 @@
     Modified: 2021-04-07
 """
 import tkinter
+from functools import partial
 from random import randint
 from tkinter import ttk
 from ttkbootstrap import Style
@@ -25,15 +26,18 @@ class Equalizer(ttk.Frame):
         self.configure(padding=20)
         controls = ['VOL', '31.25', '62.5', '125', '250', '500', '1K', '2K', '4K', '8K', '16K', 'GAIN']
 
+        # the bands are placed side by side in a single grid row, which stretches to the full height
+        self.rowconfigure(0, weight=1)
+
         # create band widgets
-        for c in controls:
+        for i, c in enumerate(controls):
             # starting random value
             value = randint(1, 99)
             self.setvar(c, value)
 
             # container
             frame = ttk.Frame(self, padding=5)
-            frame.pack(side='left', fill='y', padx=10)
+            frame.grid(row=0, column=i, sticky='ns', padx=10)
 
             # header
             ttk.Label(frame, text=c, anchor='center', font=('Helvetica 10 bold')).pack(side='top', fill='x', pady=10)
@@ -41,7 +45,7 @@ class Equalizer(ttk.Frame):
             # slider
             scale = ttk.Scale(frame, orient='vertical', from_=99, to=1, value=value)
             scale.pack(fill='y')
-            scale.configure(command=lambda val, name=c: self.setvar(name, f'{float(val):.0f}'))
+            scale.configure(command=partial(self.on_slide, c))
 
             # set slider style
             scale.configure(style='success.Vertical.TScale' if c in ['VOL', 'GAIN'] else 'info.Vertical.TScale')
@@ -49,6 +53,14 @@ class Equalizer(ttk.Frame):
             # slider value label
             ttk.Label(frame, textvariable=c).pack(pady=10)
 
+    def on_slide(self, name, value):
+        """Show the slider value, rounded to a whole number, in the band's value label
+
+        :param str name: the band name; also the name of the value label's variable
+        :param str value: the slider value
+        """
+        self.setvar(name, round(float(value)))
+
 
 if __name__ == '__main__':
     Application().mainloop()
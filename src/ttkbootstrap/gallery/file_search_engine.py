@@ -5,10 +5,14 @@
 """
 import csv
 import datetime
+import os
 import pathlib
+import re
 import tkinter
-from queue import Queue
-from threading import Thread
+from concurrent.futures import ThreadPoolExecutor
+from operator import methodcaller
+from queue import Empty, Queue
+from threading import Event, Thread
 from tkinter import ttk
 from tkinter.filedialog import askdirectory, asksaveasfilename
 
@@ -26,6 +30,18 @@ class Application(tkinter.Tk):
 
 
 class SearchEngine(ttk.Frame):
+    # number of rows passed through the file queue at a time
+    BATCH_SIZE = 256
+
+    # the prefix and suffix search types; each is also the name of the str method that tests a file name
+    MATCH_METHODS = frozenset(('startswith', 'endswith'))
+
+    # directories that are not searched, in addition to hidden directories (names starting with a dot)
+    SKIP_DIRECTORIES = frozenset({'node_modules', '__pycache__', 'Library', 'AppData'})
+
+    # number of threads that read the subdirectory trees of the search path in parallel
+    MAX_WORKERS = 8
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         # application variables
@@ -33,6 +49,8 @@ class SearchEngine(ttk.Frame):
         self.search_term_var = tkinter.StringVar(value='txt')
         self.search_type_var = tkinter.StringVar(value='endswidth')
         self.search_count = 0
+        self.active_searches = 0
+        self.followed_search = None  # the search whose newest result is selected and scrolled into view
 
         # container for user input
         input_labelframe = ttk.Labelframe(self, text='Complete the form to begin your search', padding=(20, 10, 10, 5))
@@ -93,6 +111,14 @@ class SearchEngine(ttk.Frame):
         self.tree.bind('<Double-1>', self.on_doubleclick_tree)
         self.tree.bind('<Button-3>', self.right_click_tree)
 
+        # stop following new results once the user scrolls the tree
+        for sequence in ('<MouseWheel>', '<Button-4>', '<Button-5>'):
+            self.tree.bind(sequence, self.on_user_scroll, add='+')
+
+    def on_user_scroll(self, event=None):
+        """Callback for scrolling the tree"""
+        self.followed_search = None
+
     def on_browse(self):
         """Callback for directory browse"""
         path = askdirectory(title='Directory')
@@ -124,17 +150,26 @@ class SearchEngine(ttk.Frame):
 
     def on_search(self):
         """Search for a term based on the search type"""
-        search_term = self.search_term_var.get()
+        # several terms may be separated with spaces or commas; a file matches if it matches any of them
+        search_terms = tuple(self.search_term_var.get().replace(',', ' ').split())
         search_path = self.search_path_var.get()
         search_type = self.search_type_var.get()
-        if search_term == '':
+        if not search_terms:
             return
-        Thread(target=SearchEngine.file_search, args=(search_term, search_path, search_type), daemon=True).start()
-        self.progressbar.start(10)
+        # each search has its own result queue and status, so that searches can overlap
+        file_queue = Queue()
+        searching = Event()
+        searching.set()
+        Thread(target=SearchEngine.file_search, args=(search_terms, search_path, search_type, file_queue, searching),
+               daemon=True).start()
+        if self.active_searches == 0:
+            self.progressbar.start(10)
+        self.active_searches += 1
         self.search_count += 1
         id = self.tree.insert('', 'end', self.search_count, text=f'Search {self.search_count}')
         self.tree.item(id, open=True)
-        self.check_queue(id)
+        self.followed_search = id
+        self.check_queue(id, file_queue, searching)
 
     def reveal_in_explorer(self, id):
         """Callback for double-click event on tree"""
@@ -163,98 +198,161 @@ class SearchEngine(ttk.Frame):
         # open file in explorer
         pathlib.os.startfile(filename)
 
-    def check_queue(self, id):
-        """Check file queue and print results if not empty"""
-        if searching and not file_queue.empty():
-            filename = file_queue.get()
-            self.insert_row(filename, id)
-            self.update_idletasks()
-            self.after(1, lambda: self.check_queue(id))
-        elif not searching and not file_queue.empty():
-            while not file_queue.empty():
-                filename = file_queue.get()
-                self.insert_row(filename, id)
-            self.update_idletasks()
-            self.progressbar.stop()
-        elif searching and file_queue.empty():
-            self.after(100, lambda: self.check_queue(id))
+    def check_queue(self, id, file_queue, searching):
+        """Check file queue and insert about ``BATCH_SIZE`` results per check; if this is the latest search and the
+        user has not scrolled the tree since it started, the last result is selected and scrolled into view once per
+        check instead of once per row"""
+        # read the status before draining, so that results queued just before the search finished are not missed
+        still_searching = searching.is_set()
+        iid = None
+        inserted = 0
+        while inserted < SearchEngine.BATCH_SIZE:
+            try:
+                rows = file_queue.get_nowait()
+            except Empty:
+                break
+            for row in rows:
+                iid = self.insert_row(row, id)
+            inserted += len(rows)
+        if iid and id == self.followed_search:
+            self.tree.selection_set(iid)
+            self.tree.see(iid)
+        self.update_idletasks()
+        if still_searching or not file_queue.empty():
+            self.after(16, self.check_queue, id, file_queue, searching)
         else:
-            self.progressbar.stop()
+            self.active_searches -= 1
+            if self.active_searches == 0:
+                self.progressbar.stop()
+
+    def insert_row(self, row, id):
+        """Insert new row in tree search results and return its item id
+
+        :param tuple row: the name, modified date, type, size, and path of a matching file; see ``file_row``
+        :param str id: the tree item of the search
+        """
+        file_name, *values = row
+        return self.tree.insert(id, 'end', text=file_name, values=values)
+
+    @staticmethod
+    def file_row(file):
+        """Format the tree row of a matching file; this runs on the search thread so that the stat call and the
+        formatting are kept off the event loop. Returns ``None`` if the file cannot be read or its modified date is
+        out of range.
 
-    def insert_row(self, file, id):
-        """Insert new row in tree search results"""
+        :param os.DirEntry file: the directory entry of a matching file
+        """
         try:
             file_stats = file.stat()
-            file_name = file.stem
             file_modified = datetime.datetime.fromtimestamp(file_stats.st_mtime).strftime('%m/%d/%Y %I:%M:%S%p')
-            file_type = file.suffix.lower()
-            file_size = SearchEngine.convert_size(file_stats.st_size)
-            file_path = file.absolute()
-            iid = self.tree.insert(id, 'end', text=file_name, values=(file_modified, file_type, file_size, file_path))
-            self.tree.selection_set(iid)
-            self.tree.see(iid)
-        except OSError:
-            return
+        except (OSError, OverflowError, ValueError):
+            return None
+        file_name, file_type = os.path.splitext(file.name)
+        file_size = SearchEngine.convert_size(file_stats.st_size)
+        return file_name, file_modified, file_type.lower(), file_size, os.path.abspath(file.path)
 
     @staticmethod
-    def file_search(term, search_path, search_type):
-        """Recursively search directory for matching files"""
-        SearchEngine.set_searching(1)
-        if search_type == 'contains':
-            SearchEngine.find_contains(term, search_path)
-        elif search_type == 'startswith':
-            SearchEngine.find_startswith(term, search_path)
-        elif search_type == 'endswith':
-            SearchEngine.find_endswith(term, search_path)
+    def file_search(terms, search_path, search_type, file_queue, searching):
+        """Recursively search directory for matching files
 
-    @staticmethod
-    def find_contains(term, search_path):
-        """Find all files that contain the search term"""
-        for path, _, files in pathlib.os.walk(search_path):
-            if files:
-                for file in files:
-                    if term in file:
-                        file_queue.put(pathlib.Path(path) / file)
-        SearchEngine.set_searching(False)
+        :param tuple[str] terms: the search terms
+        :param Queue file_queue: the queue that receives the rows of the matching files
+        :param Event searching: the search status; cleared when the search is finished
+        """
+        try:
+            # the file name test is chosen once per search rather than once per file
+            match = SearchEngine.name_matcher(terms, search_type)
+            if match:
+                # the search path itself is read here; each of its subdirectory trees is then read on a worker thread,
+                # so that the directory reads, which release the GIL, overlap
+                subdirectories = []
+                files = (file for file in SearchEngine.scan_files(search_path, subdirectories) if match(file.name))
+                SearchEngine.queue_rows(files, file_queue)
+                with ThreadPoolExecutor(max_workers=SearchEngine.MAX_WORKERS) as executor:
+                    futures = []
+                    for path in subdirectories:
+                        files = (file for file in SearchEngine.scan_files(path) if match(file.name))
+                        futures.append(executor.submit(SearchEngine.queue_rows, files, file_queue))
+                    # wait for every subdirectory; an error on a worker thread is raised here instead of being lost
+                    for future in futures:
+                        future.result()
+        finally:
+            searching.clear()
 
     @staticmethod
-    def find_startswith(term, search_path):
-        """Find all files that start with the search term"""
-        for path, _, files in pathlib.os.walk(search_path):
-            if files:
-                for file in files:
-                    if file.startswith(term):
-                        file_queue.put(pathlib.Path(path) / file)
-        SearchEngine.set_searching(False)
+    def name_matcher(terms, search_type):
+        """Get the function that tests whether a file name matches any of the search terms, or ``None`` if the
+        search type is unknown. Prefix and suffix tests pass all terms to a single ``str`` method call; the contains
+        test searches for all terms at once with one regular expression.
+
+        :param tuple[str] terms: the search terms
+        :param str search_type: contains, startswith, or endswith
+        """
+        if search_type == 'contains':
+            return re.compile('|'.join(map(re.escape, terms))).search
+        if search_type in SearchEngine.MATCH_METHODS:
+            return methodcaller(search_type, terms)
+        return None
 
     @staticmethod
-    def find_endswith(term, search_path):
-        """Find all files that end with the search term"""
-        for path, _, files in pathlib.os.walk(search_path):
-            if files:
-                for file in files:
-                    if file.endswith(term):
-                        file_queue.put(pathlib.Path(path) / file)
-        SearchEngine.set_searching(False)
+    def queue_rows(files, file_queue):
+        """Format the row of each matching file and put the rows on the file queue in lists of ``BATCH_SIZE``
+
+        :param Iterable[os.DirEntry] files: the matching files
+        :param Queue file_queue: the queue that receives the rows
+        """
+        batch = []
+        for file in files:
+            row = SearchEngine.file_row(file)
+            if row:
+                batch.append(row)
+                if len(batch) == SearchEngine.BATCH_SIZE:
+                    file_queue.put(batch)
+                    batch = []
+        if batch:
+            file_queue.put(batch)
 
     @staticmethod
-    def set_searching(state=False):
-        """Set searching status"""
-        global searching
-        searching = state
+    def scan_files(search_path, subdirectories=None):
+        """Yield the directory entry of each file below the search path; if a ``subdirectories`` list is given, only
+        the files directly in the search path are yielded, and its subdirectories are added to the list instead
+
+        Directories are read with ``os.scandir``; the entries carry their file type, so no extra ``stat`` call is
+        needed to tell files from directories, and ``DirEntry.stat`` is cached for ``file_row``. Subdirectories are
+        kept on a stack rather than recursed into, so the depth of the tree is not limited by the recursion limit.
+        Hidden directories and ``SKIP_DIRECTORIES`` are left out when they are found, so they are never read.
+        """
+        stack = [search_path]
+        push = stack.append if subdirectories is None else subdirectories.append
+        pop = stack.pop
+        skip = SearchEngine.SKIP_DIRECTORIES
+        while stack:
+            try:
+                entries = os.scandir(pop())
+            except OSError:
+                continue
+            with entries:
+                for entry in entries:
+                    try:
+                        is_dir = entry.is_dir(follow_symlinks=False)
+                        # files and links to files; links to directories are neither searched nor listed
+                        is_file = not is_dir and entry.is_file()
+                    except OSError:
+                        continue
+                    if is_dir:
+                        name = entry.name
+                        if not name.startswith('.') and name not in skip:
+                            push(entry.path)
+                    elif is_file:
+                        yield entry
 
     @staticmethod
     def convert_size(size):
         """Convert bytes to mb or kb depending on scale"""
-        kb = size // 1000
-        mb = round(kb / 1000, 1)
-        if kb > 1000:
-            return f'{mb:,.1f} MB'
-        else:
-            return f'{kb:,d} KB'
+        if size >= 1_000_000:
+            return f'{size / 1_000_000:,.1f} MB'
+        return f'{size // 1000:,d} KB'
 
 
 if __name__ == '__main__':
-    file_queue = Queue()
-    searching = False
     Application().mainloop()
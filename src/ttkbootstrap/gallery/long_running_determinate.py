@@ -1,5 +1,5 @@
 import tkinter
-from queue import Queue
+from queue import Empty, Queue
 from random import randint
 from threading import Thread
 from time import sleep
@@ -26,7 +26,10 @@ class LongRunning(ttk.Frame):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.configure(padding=20)
-        self.task_queue = Queue()
+
+        # each task puts its thread number on this queue when it finishes
+        self.done_queue = Queue()
+        self.tasks_completed = 0
 
         # instructions
         lbl = ttk.Label(self, text="Click the START button to begin a \n"
@@ -45,26 +48,35 @@ class LongRunning(ttk.Frame):
     def simulated_blocking_io_task(self, thread_num):
         """A simulated IO operation to run for a random time interval between 5 and 10 seconds"""
         seconds_to_run = randint(5, 15)
-        sleep(seconds_to_run)
-        self.task_queue.task_done()
+        try:
+            sleep(seconds_to_run)
+        finally:
+            self.done_queue.put(thread_num)
         print('Finished task on Thread:', thread_num)
 
     def start_task(self):
         """Start the progressbar and run the task in another thread"""
         self.btn.configure(state='disabled')
+        self.done_queue = Queue()
+        self.tasks_completed = 0
+        self.progressbar.configure(value=0)
         for i in range(1, 11):
-            self.task_queue.put(Thread(target=self.simulated_blocking_io_task, args=[i], daemon=True).start())
+            Thread(target=self.simulated_blocking_io_task, args=[i], daemon=True).start()
         self.listen_for_complete_task()
 
     def listen_for_complete_task(self):
-        """Check to see if task is complete; if so, stop the progressbar and show and alert"""
-        if self.task_queue.unfinished_tasks == 0:
-            self.progressbar.configure(value=10)
+        """Count the tasks completed since the last check; when all are complete, show an alert"""
+        while True:
+            try:
+                self.done_queue.get_nowait()
+            except Empty:
+                break
+            self.tasks_completed += 1
+        self.progressbar.configure(value=self.tasks_completed)
+        if self.tasks_completed == 10:
             showinfo(title='alert', message="process complete")
             self.btn.configure(state='normal')
             return
-        tasks_completed = self.progressbar['maximum'] - self.task_queue.unfinished_tasks
-        self.progressbar.configure(value=tasks_completed)
         self.after(500, self.listen_for_complete_task)
 
 
@@ -4,13 +4,16 @@
     Adapted for ttkbootstrap from: https://magicutilities.net/magic-mouse/features
 """
 import tkinter
-from tkinter import PhotoImage
+from pathlib import Path
 from tkinter import ttk
 from tkinter.messagebox import showinfo
 
 from ttkbootstrap import Style
 
 
+ASSETS = Path(__file__).resolve().parent / 'assets'
+
+
 class Application(tkinter.Tk):
 
     def __init__(self):
@@ -34,14 +37,14 @@ class MouseUtilities(ttk.Frame):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.images = {
-            'reset': PhotoImage(name='reset', file='assets/magic_mouse/icons8_reset_24px.png'),
-            'reset-small': PhotoImage(name='reset-small', file='assets/magic_mouse/icons8_reset_16px.png'),
-            'submit': PhotoImage(name='submit', file='assets/magic_mouse/icons8_submit_progress_24px.png'),
-            'question': PhotoImage(name='question', file='assets/magic_mouse/icons8_question_mark_16px.png'),
-            'direction': PhotoImage(name='direction', file='assets/magic_mouse/icons8_move_16px.png'),
-            'bluetooth': PhotoImage(name='bluetooth', file='assets/magic_mouse/icons8_bluetooth_2_16px.png'),
-            'buy': PhotoImage(name='buy', file='assets/magic_mouse/icons8_buy_26px_2.png'),
-            'mouse': PhotoImage(name='mouse', file='assets/magic_mouse/magic_mouse.png')
+            'reset': tkinter.PhotoImage(name='reset', file=ASSETS / 'magic_mouse/icons8_reset_24px.png'),
+            'reset-small': tkinter.PhotoImage(name='reset-small', file=ASSETS / 'magic_mouse/icons8_reset_16px.png'),
+            'submit': tkinter.PhotoImage(name='submit', file=ASSETS / 'magic_mouse/icons8_submit_progress_24px.png'),
+            'question': tkinter.PhotoImage(name='question', file=ASSETS / 'magic_mouse/icons8_question_mark_16px.png'),
+            'direction': tkinter.PhotoImage(name='direction', file=ASSETS / 'magic_mouse/icons8_move_16px.png'),
+            'bluetooth': tkinter.PhotoImage(name='bluetooth', file=ASSETS / 'magic_mouse/icons8_bluetooth_2_16px.png'),
+            'buy': tkinter.PhotoImage(name='buy', file=ASSETS / 'magic_mouse/icons8_buy_26px_2.png'),
+            'mouse': tkinter.PhotoImage(name='mouse', file=ASSETS / 'magic_mouse/magic_mouse.png')
         }
 
         for i in range(3):
@@ -121,22 +124,10 @@ class MouseUtilities(ttk.Frame):
         ttk.Button(op5, image='bluetooth', style='Link.TButton', command=self.callback).pack(side='right')
 
         ### scroll speed
-        scroll_speed_frame = ttk.Frame(scrolling)
-        scroll_speed_frame.pack(fill='x', padx=(20, 0), pady=5)
-        ttk.Label(scroll_speed_frame, text='Speed:').pack(side='left')
-        ttk.Scale(scroll_speed_frame, value=35, from_=1, to=100).pack(side='left', fill='x', expand='yes', padx=5)
-        scroll_speed_btn = ttk.Button(scroll_speed_frame, image='reset-small', style='Link.TButton')
-        scroll_speed_btn.configure(command=self.callback)
-        scroll_speed_btn.pack(side='left')
+        self.create_slider_row(scrolling, 'Speed:', 35, pady=5)
 
         ### scroll sense
-        scroll_sense_frame = ttk.Frame(scrolling)
-        scroll_sense_frame.pack(fill='x', padx=(20, 0), pady=(5, 0))
-        ttk.Label(scroll_sense_frame, text='Sense:').pack(side='left')
-        ttk.Scale(scroll_sense_frame, value=50, from_=1, to=100).pack(side='left', fill='x', expand='yes', padx=5)
-        scroll_sense_btn = ttk.Button(scroll_sense_frame, image='reset-small', style='Link.TButton')
-        scroll_sense_btn.configure(command=self.callback)
-        scroll_sense_btn.pack(side='left')
+        self.create_slider_row(scrolling, 'Sense:', 50)
 
         ## 1 finger gestures -------------------------------------------------------------------------------------------
         finger_gest = ttk.Labelframe(col2, text='1 Finger Gestures', padding=(15, 10))
@@ -147,16 +138,7 @@ class MouseUtilities(ttk.Frame):
         ttk.Checkbutton(finger_gest, text='Swap swipe direction', variable='op7').pack(fill='x', padx=(20, 0), pady=5)
 
         ### gest sense
-        gest_sense_frame = ttk.Frame(finger_gest)
-        gest_sense_frame.pack(fill='x', padx=(20, 0), pady=(5, 0))
-
-        ttk.Label(gest_sense_frame, text='Sense:').pack(side='left')
-
-        ttk.Scale(gest_sense_frame, value=50, from_=1, to=100).pack(side='left', fill='x', expand='yes', padx=5)
-
-        gest_sense_btn = ttk.Button(gest_sense_frame, image='reset-small', style='Link.TButton')
-        gest_sense_btn.configure(command=self.callback)
-        gest_sense_btn.pack(side='left')
+        self.create_slider_row(finger_gest, 'Sense:', 50)
 
         ## middle click ------------------------------------------------------------------------------------------------
         middle_click = ttk.Labelframe(col2, text='Middle Click', padding=(15, 10))
@@ -181,16 +163,7 @@ class MouseUtilities(ttk.Frame):
         op8.pack(fill='x', padx=(20, 0), pady=5)
 
         ### gest sense
-        gest_sense_frame = ttk.Frame(two_finger_gest)
-        gest_sense_frame.pack(fill='x', padx=(20, 0), pady=(5, 0))
-
-        ttk.Label(gest_sense_frame, text='Sense:').pack(side='left')
-
-        ttk.Scale(gest_sense_frame, value=50, from_=1, to=100).pack(side='left', fill='x', expand='yes', padx=5)
-
-        gest_sense_btn = ttk.Button(gest_sense_frame, image='reset-small', style='Link.TButton')
-        gest_sense_btn.configure(command=self.callback)
-        gest_sense_btn.pack(side='left')
+        self.create_slider_row(two_finger_gest, 'Sense:', 50)
 
         ### fast two finger swipe down
         ttk.Label(two_finger_gest, text='On fast 2 finger up/down swipe:').pack(fill='x', pady=(10, 5))
@@ -206,16 +179,7 @@ class MouseUtilities(ttk.Frame):
         two_finger_cbo.pack(fill='x', padx=(20, 0), pady=5)
 
         ### two finger sense
-        two_finger_sense_frame = ttk.Frame(two_finger_gest)
-        two_finger_sense_frame.pack(fill='x', padx=(20, 0), pady=(5, 0))
-
-        ttk.Label(two_finger_sense_frame, text='Sense:').pack(side='left')
-
-        ttk.Scale(two_finger_sense_frame, value=50, from_=1, to=100).pack(side='left', fill='x', expand='yes', padx=5)
-
-        two_finger_sense_btn = ttk.Button(two_finger_sense_frame, image='reset-small', style='Link.TButton')
-        two_finger_sense_btn.configure(command=self.callback)
-        two_finger_sense_btn.pack(side='left')
+        self.create_slider_row(two_finger_gest, 'Sense:', 50)
 
         ## mouse options -----------------------------------------------------------------------------------------------
         mouse_options = ttk.Labelframe(col3, text='2 Finger Gestures', padding=(15, 10))
@@ -231,16 +195,7 @@ class MouseUtilities(ttk.Frame):
         op13.pack(fill='x', pady=5)
 
         ### base speed
-        base_speed_sense_frame = ttk.Frame(mouse_options)
-        base_speed_sense_frame.pack(fill='x', padx=(20, 0), pady=(5, 0))
-
-        ttk.Label(base_speed_sense_frame, text='Base speed:').pack(side='left')
-
-        ttk.Scale(base_speed_sense_frame, value=50, from_=1, to=100).pack(side='left', fill='x', expand='yes', padx=5)
-
-        base_speed_sense_btn = ttk.Button(base_speed_sense_frame, image='reset-small', style='Link.TButton')
-        base_speed_sense_btn.configure(command=self.callback)
-        base_speed_sense_btn.pack(side='left')
+        self.create_slider_row(mouse_options, 'Base speed:', 50)
 
         # turn on all checkbuttons
         for i in range(1, 14):
@@ -250,6 +205,21 @@ class MouseUtilities(ttk.Frame):
         for j in [2, 9, 12, 13]:
             self.setvar(f'op{j}', 0)
 
+    def create_slider_row(self, parent, text, value, pady=(5, 0)):
+        """Add a row with a label, a slider, and a reset button to the parent frame
+
+        :param ttk.Frame parent: the container of the row
+        :param str text: the label text
+        :param int value: the starting slider value; the slider ranges from 1 to 100
+        :param pady: the vertical padding of the row
+        """
+        row = ttk.Frame(parent)
+        row.pack(fill='x', padx=(20, 0), pady=pady)
+        ttk.Label(row, text=text).pack(side='left')
+        ttk.Scale(row, value=value, from_=1, to=100).pack(side='left', fill='x', expand='yes', padx=5)
+        ttk.Button(row, image='reset-small', style='Link.TButton', command=self.callback).pack(side='left')
+        return row
+
     def callback(self):
         """Demo callback"""
         showinfo(title='Button callback', message="You pressed a button.")
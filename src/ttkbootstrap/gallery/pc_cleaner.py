@@ -4,11 +4,15 @@
     Adapted from: https://images.idgesg.net/images/article/2018/08/cw_win10_utilities_ss_02-100769136-orig.jpg
 """
 import tkinter
+from pathlib import Path
 from tkinter import ttk
 
 from ttkbootstrap import Style
 
 
+ASSETS = Path(__file__).resolve().parent / 'assets'
+
+
 class Application(tkinter.Tk):
 
     def __init__(self):
@@ -31,14 +35,14 @@ class Cleaner(ttk.Frame):
         super().__init__(*args, **kwargs)
 
         # application images
-        self.logo_img = tkinter.PhotoImage(name='logo', file='assets/icons8_broom_64px_1.png')
-        self.brush_img = tkinter.PhotoImage(name='cleaner', file='assets/icons8_broom_64px.png')
-        self.registry_img = tkinter.PhotoImage(name='registry', file='assets/icons8_registry_editor_64px.png')
-        self.tools_img = tkinter.PhotoImage(name='tools', file='assets/icons8_wrench_64px.png')
-        self.options_img = tkinter.PhotoImage(name='options', file='assets/icons8_settings_64px.png')
-        self.privacy_img = tkinter.PhotoImage(name='privacy', file='assets/icons8_spy_80px.png')
-        self.junk_img = tkinter.PhotoImage(name='junk', file='assets/icons8_trash_can_80px.png')
-        self.protect_img = tkinter.PhotoImage(name='protect', file='assets/icons8_protect_40px.png')
+        self.logo_img = tkinter.PhotoImage(name='logo', file=ASSETS / 'icons8_broom_64px_1.png')
+        self.brush_img = tkinter.PhotoImage(name='cleaner', file=ASSETS / 'icons8_broom_64px.png')
+        self.registry_img = tkinter.PhotoImage(name='registry', file=ASSETS / 'icons8_registry_editor_64px.png')
+        self.tools_img = tkinter.PhotoImage(name='tools', file=ASSETS / 'icons8_wrench_64px.png')
+        self.options_img = tkinter.PhotoImage(name='options', file=ASSETS / 'icons8_settings_64px.png')
+        self.privacy_img = tkinter.PhotoImage(name='privacy', file=ASSETS / 'icons8_spy_80px.png')
+        self.junk_img = tkinter.PhotoImage(name='junk', file=ASSETS / 'icons8_trash_can_80px.png')
+        self.protect_img = tkinter.PhotoImage(name='protect', file=ASSETS / 'icons8_protect_40px.png')
 
         # header
         header_frame = ttk.Frame(self, padding=20, style='secondary.TFrame')
@@ -1,6 +1,7 @@
 import calendar
-import re
-from datetime import datetime
+import weakref
+from datetime import date, datetime
+from functools import lru_cache, partial
 from tkinter import IntVar, Toplevel, StringVar
 from tkinter import ttk
 from tkinter.ttk import Frame, Entry
@@ -8,7 +9,50 @@ from tkinter.ttk import Frame, Entry
 from PIL import Image, ImageTk, ImageDraw
 from ttkbootstrap import Style
 
-COLOR_PATTERN = re.compile(r'(^primary|secondary|success|info|warning|danger)')
+# color keywords that may be used as the prefix of a widget style, e.g. 'danger.TCalendar'
+_STYLE_COLORS = frozenset({'primary', 'secondary', 'success', 'info', 'warning', 'danger'})
+
+
+def _style_color(style):
+    """Find the color keyword in a ttk style name.
+
+    Args:
+        style (str): a ttk style name such as 'danger.TCalendar'.
+
+    Returns:
+        str: the color keyword, or ``None`` if the style does not contain one.
+    """
+    for part in style.split('.'):
+        if part in _STYLE_COLORS:
+            return part
+    return None
+
+
+# the styles used by the parts of the date chooser popup, for each color
+_POPUP_STYLES = {
+    color: {
+        'chevron': f'chevron.{color}.TButton',
+        'exit': f'exit.{color}.TButton',
+        'title': f'{color}.Inverse.TLabel',
+        'frame': f'{color}.TFrame',
+        'selected': f'{color}.Toolbutton'}
+    for color in _STYLE_COLORS}
+
+# weekday abbreviations, starting on Monday as in the ``calendar`` module
+_WEEKDAYS = ('Mo', 'Tu', 'We', 'Th', 'Fr', 'Sa', 'Su')
+
+
+@lru_cache(maxsize=7)
+def _weekday_names(firstweekday):
+    """Rotate the weekday abbreviations so that they start on ``firstweekday``.
+
+    Args:
+        firstweekday (int): the first day of the week. ``0`` is Monday, ``6`` is Sunday.
+
+    Returns:
+        Tuple[str]: the weekday abbreviations.
+    """
+    return _WEEKDAYS[firstweekday:] + _WEEKDAYS[:firstweekday]
 
 
 def ask_date(parent=None,
@@ -47,6 +91,11 @@ class DateEntry(Frame):
     on `Sunday`, which is the widget default.
     """
 
+    # calendar button images are shared by every date entry with the same foreground color; keyed by Tk root and then
+    # by color, because an image cannot be used outside of the interpreter that created it. The images of a root are
+    # released with the root.
+    _button_images = weakref.WeakKeyDictionary()
+
     def __init__(self,
                  master=None,
                  dateformat='%Y-%m-%d',
@@ -77,9 +126,11 @@ class DateEntry(Frame):
         # calendar button
         image_color = self.tk.call("ttk::style", "lookup", button_style, '-%s' % 'foreground', None, None)
         if 'system' in image_color.lower():
-            self.image = self.draw_button_image(self.convert_system_color(image_color))
-        else:
-            self.image = self.draw_button_image(image_color)
+            image_color = self.convert_system_color(image_color)
+        images = DateEntry._button_images.setdefault(self._root(), {})
+        self.image = images.get(image_color)
+        if self.image is None:
+            self.image = images[image_color] = self.draw_button_image(image_color)
         self.button = ttk.Button(self, image=self.image, command=self.on_date_ask, padding=(2, 2), style=button_style)
         self.button.pack(side='left')
 
@@ -141,8 +192,8 @@ class DateEntry(Frame):
         Returns:
             Tuple[str]: the styles to be used for entry and button widgets.
         """
-        match = re.search(COLOR_PATTERN, self.base_style)
-        color = '' if not match else match.group(0) + '.'
+        color = _style_color(self.base_style)
+        color = '' if not color else color + '.'
         entry_style = f'{color}TEntry'
         button_style = f'{color}TButton'
         return entry_style, button_style
@@ -209,51 +260,89 @@ class DateChooserPopup:
         self.date_selected = startdate or datetime.today()
         self.date = startdate or self.date_selected
         self.calendar = calendar.Calendar(firstweekday=firstweekday)
+        self.monthdates_cache = {}  # the weeks of each month shown so far, keyed by (year, month)
+        self.weekdays = self.weekday_header()
 
         self.cframe = ttk.Frame(self.root, padding=0, borderwidth=1, relief='raised', style=self.styles['frame'])
         self.xframe = ttk.Frame(self.cframe, style=self.styles['frame'])
         self.tframe = ttk.Frame(self.cframe, style=self.styles['frame'])
         self.wframe = ttk.Frame(self.cframe)
         self.dframe = None
+        self.position = None  # the screen position of the popup; computed once when the geometry is first set
+        self.window_geometry = None  # the last geometry string applied to the popup
 
         self.titlevar = StringVar(value=f'{self.date.strftime("%B %Y")}')
         self.datevar = IntVar()
 
         self.setup()
+        self.root.wait_visibility()  # a grab on a window that is not yet viewable fails on X11
         self.root.grab_set()
         self.root.wait_window()
 
+    def create_day_cells(self):
+        """Create the widgets for the calendar days. A radiobutton is created once for each cell of a 6 week calendar
+        and then reconfigured every time the month changes; the days outside of the current month are disabled and
+        drawn as a label."""
+        self.dframe = ttk.Frame(self.cframe)
+        self.dframe.grid(row=3, column=0, sticky='nswe')
+        self.day_buttons = []
+
+        # all columns share the same width
+        for col in range(7):
+            self.dframe.columnconfigure(col, weight=1, uniform='day')
+
+        for row in range(6):
+            buttons = []
+            for col in range(7):
+                rb = ttk.Radiobutton(self.dframe, variable=self.datevar, padding=(0, 0, 0, 10),
+                                     command=partial(self.on_date_selected, (row, col)))
+                rb.grid(row=row, column=col, sticky='nswe')
+                buttons.append(rb)
+            self.day_buttons.append(buttons)
+        self.sixth_week_shown = True  # all 6 weeks are gridded when the cells are created
+
     def draw_calendar(self):
-        """Create the days of the week elements"""
+        """Update the calendar days for the current month"""
+        if not self.root.winfo_exists():
+            # the popup was closed before the calendar was drawn
+            return
         self.titlevar.set(f'{self.date.strftime("%B %Y")}')
-        self.monthdays = self.calendar.monthdayscalendar(self.date.year, self.date.month)
-        self.monthdates = self.calendar.monthdatescalendar(self.date.year, self.date.month)
+        self.monthdates = self.get_monthdates(self.date.year, self.date.month)
 
-        self.dframe = ttk.Frame(self.cframe)
-        self.dframe.pack(fill='both', expand='yes')
+        if self.dframe is None:
+            self.create_day_cells()
         self.set_geometry()
 
+        # values that are the same for every day of the month
+        cur_month = self.date.month
+        # the selected day only needs to be compared by day number when it falls in the displayed month
+        if (self.date_selected.year, self.date_selected.month) == (self.date.year, cur_month):
+            sel_day = self.date_selected.day
+        else:
+            sel_day = None
+        calendar_style, selected_style = self.styles['calendar'], self.styles['selected']
+
+        # the 6th week is only shown for the months that need it
+        sixth_week = len(self.monthdates) == 6
+        if sixth_week != self.sixth_week_shown:
+            for rb in self.day_buttons[5]:
+                if sixth_week:
+                    rb.grid()
+                else:
+                    rb.grid_remove()
+            self.sixth_week_shown = sixth_week
+
         # calendar days
-        for row, wk in enumerate(self.monthdays):
-            for col, day in enumerate(wk):
-                self.dframe.columnconfigure(col, weight=1)
-                if day == 0:
-                    lbl = ttk.Label(self.dframe, text=self.monthdates[row][col].day, anchor='center')
-                    lbl.configure(style='secondary.TLabel', padding=(0, 0, 0, 10))
-                    lbl.grid(row=row, column=col, sticky='nswe')
+        for buttons, wk in zip(self.day_buttons, self.monthdates):
+            for rb, dt in zip(buttons, wk):
+                day = dt.day
+                if dt.month != cur_month:
+                    # a day of the previous or next month
+                    rb.configure(value=day, text=day, state='disabled', style='secondary.TLabel')
+                elif day == sel_day:
+                    rb.configure(value=day, text=day, state='normal', style=selected_style)
                 else:
-                    if all([
-                        day == self.date_selected.day,
-                        self.date.month == self.date_selected.month,
-                        self.date.year == self.date_selected.year
-                    ]):
-                        day_style = self.styles['selected']
-                    else:
-                        day_style = self.styles['calendar']
-
-                    rb = ttk.Radiobutton(self.dframe, variable=self.datevar, value=day, text=day, style=day_style)
-                    rb.configure(padding=(0, 0, 0, 10), command=lambda x=row, y=col: self.on_date_selected([x, y]))
-                    rb.grid(row=row, column=col, sticky='nswe')
+                    rb.configure(value=day, text=day, state='normal', style=calendar_style)
 
     def draw_titlebar(self):
         """Create the title bar"""
@@ -263,8 +352,8 @@ class DateChooserPopup:
         self.btn_prev.pack(side='left')
 
         # month and year title
-        self.title_label = ttk.Label(self.tframe, textvariable=self.titlevar, anchor='center')
-        self.title_label.configure(style=self.styles['title'], font='helvetica 11')
+        self.title_label = ttk.Label(self.tframe, textvariable=self.titlevar, anchor='center',
+                                     style=self.styles['title'], font='helvetica 11')
         self.title_label.pack(side='left', fill='x', expand='yes')
         self.title_label.bind('<Button-1>', self.on_reset_date)
 
@@ -274,20 +363,33 @@ class DateChooserPopup:
         self.btn_next.pack(side='left')
 
         # days of the week header
-        for wd in self.weekday_header():
-            wd_lbl = ttk.Label(self.wframe, text=wd, anchor='center', padding=(0, 5, 0, 10))
-            wd_lbl.configure(style='secondary.Inverse.TLabel')
-            wd_lbl.pack(side='left', fill='x', expand='yes')
+        for col, wd in enumerate(self.weekdays):
+            self.wframe.columnconfigure(col, weight=1, uniform='day')
+            wd_lbl = ttk.Label(self.wframe, text=wd, anchor='center', padding=(0, 5, 0, 10),
+                               style='secondary.Inverse.TLabel')
+            wd_lbl.grid(row=0, column=col, sticky='we')
 
     def generate_widget_styles(self):
         """Generate all the styles required for this widget from the ``base_style``."""
-        match = re.search(COLOR_PATTERN, self.styles['calendar'])
-        color = 'primary.' if not match else match.group(0) + '.'
-        self.styles.update({'chevron': f'chevron.{color}TButton'})
-        self.styles.update({'exit': f'exit.{color}TButton'})
-        self.styles.update({'title': f'{color}Inverse.TLabel'})
-        self.styles.update({'frame': f'{color}TFrame'})
-        self.styles.update({'selected': f'{color}Toolbutton'})
+        color = _style_color(self.styles['calendar']) or 'primary'
+        self.styles.update(_POPUP_STYLES[color])
+
+    def get_monthdates(self, year, month):
+        """Get the weeks of a month as lists of dates, including the days of the adjacent months that complete the
+        first and last weeks. Months are cached, so moving back and forth between months does not rebuild them.
+
+        Args:
+            year (int): the year of the month.
+            month (int): the month number; 1 is January.
+
+        Returns:
+            List[List[date]]: the weeks of the month.
+        """
+        key = year, month
+        monthdates = self.monthdates_cache.get(key)
+        if monthdates is None:
+            monthdates = self.monthdates_cache[key] = self.calendar.monthdatescalendar(year, month)
+        return monthdates
 
     def on_date_selected(self, index):
         """Callback for selecting a date.
@@ -304,81 +406,95 @@ class DateChooserPopup:
 
     def on_next_month(self):
         """Callback for changing calendar to next month"""
-        year, month = calendar._nextmonth(self.date.year, self.date.month)
-        self.date = datetime(year=year, month=month, day=1).date()
-        self.dframe.destroy()
+        year, month = self.date.year, self.date.month + 1
+        if month == 13:
+            year, month = year + 1, 1
+        self.date = date(year, month, 1)
         self.draw_calendar()
 
     def on_next_year(self, *args):
         """Callback for changing calendar to next year"""
-        year = self.date.year + 1
-        self.date = datetime(year=year, month=self.date.month, day=1).date()
-        self.dframe.destroy()
+        self.date = date(self.date.year + 1, self.date.month, 1)
         self.draw_calendar()
 
     def on_prev_month(self):
         """Callback for changing calendar to previous month"""
-        year, month = calendar._prevmonth(self.date.year, self.date.month)
-        self.date = datetime(year=year, month=month, day=1).date()
-        self.dframe.destroy()
+        year, month = self.date.year, self.date.month - 1
+        if month == 0:
+            year, month = year - 1, 12
+        self.date = date(year, month, 1)
         self.draw_calendar()
 
     def on_prev_year(self, *args):
         """Callback for changing calendar to previous year"""
-        year = self.date.year - 1
-        self.date = datetime(year=year, month=self.date.month, day=1).date()
-        self.dframe.destroy()
+        self.date = date(self.date.year - 1, self.date.month, 1)
         self.draw_calendar()
 
     def on_reset_date(self, *args):
         """Callback for clicking the month-year title; reset the date to the start date"""
         self.date = self.startdate
-        self.dframe.destroy()
         self.draw_calendar()
 
     def set_geometry(self):
         """Adjust the window size based on the number of weeks in the month"""
         w = 226
         h = 255 if len(self.monthdates) == 5 else 285  # this needs to be adjusted if I change the font size.
-        if self.parent:
-            xpos = self.parent.winfo_rootx() + self.parent.winfo_width()
-            ypos = self.parent.winfo_rooty() + self.parent.winfo_height()
-            self.root.geometry(f'{w}x{h}+{xpos}+{ypos}')
-        else:
-            xpos = self.root.winfo_screenwidth() // 2 - w
-            ypos = self.root.winfo_screenheight() // 2 - h
-            self.root.geometry(f'{w}x{h}+{xpos}+{ypos}')
+        if self.position is None:
+            # the popup does not move when the month changes, so the screen is only queried the first time
+            if self.parent:
+                # bottom-right of the parent. The popup is kept above the bottom of the virtual root window, using the
+                # height of a 6 week month so that it still fits when the month changes. The x position is not
+                # clamped: on Windows the virtual root only covers the primary monitor.
+                vrooty = self.root.winfo_vrooty()
+                xpos = self.parent.winfo_rootx() + self.parent.winfo_width()
+                ypos = self.parent.winfo_rooty() + self.parent.winfo_height()
+                ypos = max(min(ypos, vrooty + self.root.winfo_vrootheight() - 285), vrooty)
+            else:
+                # centered on the screen
+                xpos = (self.root.winfo_screenwidth() - w) // 2
+                ypos = (self.root.winfo_screenheight() - h) // 2
+            self.position = xpos, ypos
+        # the size only changes when the number of weeks changes, so the window manager is not asked to apply the
+        # same geometry again on every month change.
+        geometry = '{}x{}+{}+{}'.format(w, h, *self.position)
+        if geometry != self.window_geometry:
+            self.root.geometry(geometry)
+            self.window_geometry = geometry
 
     def setup(self):
         """Setup the calendar widget"""
-        self.cframe.pack(fill='both', expand='yes')
-        self.xframe.pack(fill='x')
-        self.tframe.pack(fill='x')
-        self.wframe.pack(fill='x')
-
-        # setup the top level window
+        # setup the top level window; all window settings are applied before the window is shown, so that it is only
+        # drawn once, in its final state.
         self.root.withdraw()  # hide the window until setup is complete
         self.root.transient(self.parent)
         self.root.overrideredirect(True)
         self.root.resizable(False, False)
-        self.cframe.update_idletasks()  # actualize the geometry
+        self.root.attributes('-topmost', True)
 
         # create the visual components
+        self.cframe.pack(fill='both', expand='yes')
+        self.cframe.columnconfigure(0, weight=1)
+        self.cframe.rowconfigure(3, weight=1)  # the calendar days
+        self.xframe.grid(row=0, column=0, sticky='we')
+        self.tframe.grid(row=1, column=0, sticky='we')
+        self.wframe.grid(row=2, column=0, sticky='we')
         ttk.Button(self.xframe, text="⨉", command=self.root.destroy, style=self.styles['exit']).pack(side='right')
         self.draw_titlebar()
-        self.draw_calendar()
+
+        # show the window right away at its final size; the calendar days are drawn on the next idle tick
+        self.monthdates = self.get_monthdates(self.date.year, self.date.month)
+        self.set_geometry()
         self.root.deiconify()  # make the window visible.
-        self.root.attributes('-topmost', True)
+        self.root.after_idle(self.draw_calendar)
 
     def weekday_header(self):
-        """Creates and returns a list of weekdays to be used as a header in the calendar based on the firstweekday. The
-        order of the weekdays is based on the ``firstweekday`` property.
+        """Returns the weekday names used as the calendar header, ordered by the ``firstweekday`` property. The tuple
+        is cached and shared by every date chooser with the same first weekday.
 
         Returns:
-            List: a list of weekday headers
+            Tuple[str]: the weekday headers
         """
-        weekdays = ['Mo', 'Tu', 'We', 'Th', 'Fr', 'Sa', 'Su']
-        return weekdays[self.firstweekday:] + weekdays[:self.firstweekday]
+        return _weekday_names(self.firstweekday)
 
 
 if __name__ == '__main__':